@@ -19,12 +19,16 @@ import time
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
 from dilithium_threshold.core.threshold import ThresholdSignature
-from dilithium_threshold.core.dilithium import Dilithium
 
 
-def main():
+def main(paranoid: bool = False):
     """
     Demonstrate basic threshold signature functionality.
+    
+    Args:
+        paranoid: Also verify each partial signature right after signing.
+            Normally the combiner catches bad shares when it verifies the
+            combined signature, so this is off by default.
     """
     print("=== Dilithium Threshold Signature Demo ===\n")
     
@@ -48,11 +52,11 @@ def main():
     
     # Distributed key generation
     print("2. Performing distributed key generation...")
-    start_time = time.time()
+    start_time = time.perf_counter_ns()
     
     key_shares = ts.distributed_keygen()
     
-    keygen_time = time.time() - start_time
+    keygen_time = (time.perf_counter_ns() - start_time) / 1e9
     print(f"   ✓ Generated {len(key_shares)} key shares")
     print(f"   ✓ Key generation time: {keygen_time:.3f} seconds")
     print()
@@ -67,36 +71,41 @@ def main():
     
     # Partial signing by threshold participants
     print("4. Creating partial signatures...")
-    start_time = time.time()
     
     # Select first 'threshold' participants for signing
     signing_participants = key_shares[:threshold]
-    partial_signatures = []
     
-    for share in signing_participants:
-        print(f"   Creating partial signature for participant {share.participant_id}...")
-        partial_sig = ts.partial_sign(message, share)
-        partial_signatures.append(partial_sig)
-        
-        # Verify partial signature
-        is_valid = ts.verify_partial_signature(message, partial_sig, share)
-        status = "✓" if is_valid else "✗"
-        print(f"   {status} Partial signature from participant {share.participant_id}")
+    start_time = time.perf_counter_ns()
+    partial_signatures = [ts.partial_sign(message, share)
+                          for share in signing_participants]
+    partial_sign_time = (time.perf_counter_ns() - start_time) / 1e9
+    
+    if paranoid:
+        # Verify all partial signatures in one batch
+        validity = ts.verify_partial_signatures_batch(
+            message, partial_signatures, signing_participants)
+        for share, is_valid in zip(signing_participants, validity):
+            status = "✓" if is_valid else "✗"
+            print(f"   {status} Partial signature from participant {share.participant_id}")
+    else:
+        # Left to the combiner, which verifies the combined signature
+        for share in signing_participants:
+            print(f"   - Partial signature from participant {share.participant_id} "
+                  f"(not verified)")
     
-    partial_sign_time = time.time() - start_time
     print(f"   ✓ Created {len(partial_signatures)} partial signatures")
     print(f"   ✓ Partial signing time: {partial_sign_time:.3f} seconds")
     print()
     
     # Combine signatures
     print("5. Combining partial signatures...")
-    start_time = time.time()
+    start_time = time.perf_counter_ns()
     
     try:
         combined_signature = ts.combine_signatures(
             partial_signatures, key_shares[0].public_key)
         
-        combine_time = time.time() - start_time
+        combine_time = (time.perf_counter_ns() - start_time) / 1e9
         print(f"   ✓ Successfully combined signatures")
         print(f"   ✓ Combination time: {combine_time:.3f} seconds")
         print()
@@ -107,13 +116,13 @@ def main():
     
     # Verify combined signature
     print("6. Verifying combined signature...")
-    start_time = time.time()
+    start_time = time.perf_counter_ns()
     
     # Use standard Dilithium verification
-    dilithium = Dilithium(security_level)
+    dilithium = ts.dilithium
     is_valid = dilithium.verify(message, combined_signature, key_shares[0].public_key)
     
-    verify_time = time.time() - start_time
+    verify_time = (time.perf_counter_ns() - start_time) / 1e9
     status = "✓" if is_valid else "✗"
     print(f"   {status} Signature verification: {'VALID' if is_valid else 'INVALID'}")
     print(f"   ✓ Verification time: {verify_time:.3f} seconds")
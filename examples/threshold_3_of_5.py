@@ -18,7 +18,6 @@ import secrets
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
 from dilithium_threshold.core.threshold import ThresholdSignature
-from dilithium_threshold.core.dilithium import Dilithium
 
 
 class Organization:
@@ -46,9 +45,9 @@ class Organization:
         
         # Generate distributed keys
         print("🔐 Generating distributed keys for organization...")
-        start_time = time.time()
+        start_time = time.perf_counter_ns()
         self.key_shares = self.ts.distributed_keygen()
-        keygen_time = time.time() - start_time
+        keygen_time = (time.perf_counter_ns() - start_time) / 1e9
         
         print(f"✅ Key generation completed in {keygen_time:.3f}s")
         print(f"📋 Key shares distributed to {len(self.key_shares)} participants:")
@@ -57,13 +56,17 @@ class Organization:
             print(f"   {i+1}. {self.participant_names[i]} (ID: {share.participant_id})")
         print()
     
-    def sign_transaction(self, transaction: bytes, signers: list) -> bool:
+    def sign_transaction(self, transaction: bytes, signers: list,
+                         paranoid: bool = False) -> bool:
         """
         Sign a transaction with specified signers.
         
         Args:
             transaction: Transaction data to sign
             signers: List of participant indices (0-based) who will sign
+            paranoid: Also verify each partial signature before combining.
+                Off by default, since verifying the combined signature
+                already rejects bad shares.
             
         Returns:
             True if signing and verification successful
@@ -75,40 +78,54 @@ class Organization:
         print(f"📝 Transaction: {transaction.decode()}")
         print(f"👥 Signers ({len(signers)}/{self.participants}):")
         
-        # Create partial signatures
+        # Create partial signatures, timing only the signing calls
         partial_signatures = []
-        signing_time_total = 0
+        signer_shares = [self.key_shares[signer_idx] for signer_idx in signers]
         
-        for signer_idx in signers:
-            signer_name = self.participant_names[signer_idx]
-            key_share = self.key_shares[signer_idx]
-            
-            print(f"   🖊️  {signer_name} signing...")
-            
-            start_time = time.time()
+        results = []
+        for key_share in signer_shares:
+            start_time = time.perf_counter_ns()
             partial_sig = self.ts.partial_sign(transaction, key_share)
-            signing_time = time.time() - start_time
-            signing_time_total += signing_time
-            
-            # Verify partial signature
-            is_valid = self.ts.verify_partial_signature(
-                transaction, partial_sig, key_share)
+            signing_time = (time.perf_counter_ns() - start_time) / 1e9
+            results.append((partial_sig, signing_time))
+        signing_time_total = sum(signing_time for _, signing_time in results)
+        
+        # Without paranoid mode the partial signatures are left to the
+        # combiner, so they are reported as not verified
+        validity = None
+        if paranoid:
+            # Verify all partial signatures in one batch
+            validity = self.ts.verify_partial_signatures_batch(
+                transaction, [partial_sig for partial_sig, _ in results], signer_shares)
+        
+        # Buffer the per-signer report and print it in one go
+        report = []
+        for i, (signer_idx, (partial_sig, signing_time)) in enumerate(zip(signers, results)):
+            signer_name = self.participant_names[signer_idx]
+            report.append(f"   🖊️  {signer_name} signing...")
             
-            if is_valid:
+            if validity is None:
+                partial_signatures.append(partial_sig)
+                report.append(f"      ✅ Partial signature created "
+                              f"({signing_time:.3f}s, not verified)")
+            elif validity[i]:
                 partial_signatures.append(partial_sig)
-                print(f"      ✅ Partial signature created ({signing_time:.3f}s)")
+                report.append(f"      ✅ Partial signature created and verified "
+                              f"({signing_time:.3f}s)")
             else:
-                print(f"      ❌ Partial signature verification failed!")
+                report.append(f"      ❌ Partial signature verification failed!")
+                print("\n".join(report))
                 return False
+        print("\n".join(report))
         
         # Combine signatures
         print(f"🔗 Combining {len(partial_signatures)} partial signatures...")
-        start_time = time.time()
+        start_time = time.perf_counter_ns()
         
         try:
             combined_signature = self.ts.combine_signatures(
                 partial_signatures, self.key_shares[0].public_key)
-            combine_time = time.time() - start_time
+            combine_time = (time.perf_counter_ns() - start_time) / 1e9
             print(f"   ✅ Signatures combined ({combine_time:.3f}s)")
             
         except Exception as e:
@@ -117,12 +134,11 @@ class Organization:
         
         # Verify combined signature
         print("🔍 Verifying combined signature...")
-        start_time = time.time()
+        start_time = time.perf_counter_ns()
         
-        dilithium = Dilithium(self.security_level)
-        is_valid = dilithium.verify(
+        is_valid = self.ts.dilithium.verify(
             transaction, combined_signature, self.key_shares[0].public_key)
-        verify_time = time.time() - start_time
+        verify_time = (time.perf_counter_ns() - start_time) / 1e9
         
         if is_valid:
             print(f"   ✅ Signature verification successful ({verify_time:.3f}s)")
@@ -151,7 +167,8 @@ class Organization:
         insufficient_signers = [0, 1]  # Only 2 signers
         print(f"Attempting to sign with only {len(insufficient_signers)} signers...")
         
-        success = self.sign_transaction(transaction, insufficient_signers)
+        success = self.sign_transaction(
+            transaction, insufficient_signers, paranoid=True)
         if not success:
             print("✅ Threshold property verified: insufficient signers rejected")
         else:
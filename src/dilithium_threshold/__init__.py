@@ -13,10 +13,17 @@ __version__ = "1.0.0"
 __author__ = "Leonid Kartushin"
 __email__ = "leonid.kartushin@example.com"
 
-from .core.threshold import ThresholdSignature
-from .core.dilithium import Dilithium
-from .core.shamir import AdaptedShamirSSS
-from .crypto.polynomials import Polynomial, PolynomialVector
+import importlib
+
+# Public names are imported on first access (PEP 562), so importing the
+# package does not load NumPy or the core modules until they are needed.
+_LAZY = {
+    "ThresholdSignature": ("dilithium_threshold.core.threshold", "ThresholdSignature"),
+    "Dilithium": ("dilithium_threshold.core.dilithium", "Dilithium"),
+    "AdaptedShamirSSS": ("dilithium_threshold.core.shamir", "AdaptedShamirSSS"),
+    "Polynomial": ("dilithium_threshold.crypto.polynomials", "Polynomial"),
+    "PolynomialVector": ("dilithium_threshold.crypto.polynomials", "PolynomialVector"),
+}
 
 __all__ = [
     "ThresholdSignature",
@@ -26,3 +33,16 @@ __all__ = [
     "PolynomialVector"
 ]
 
+
+def __getattr__(name):
+    if name not in _LAZY:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module_name, attr = _LAZY[name]
+    value = getattr(importlib.import_module(module_name), attr)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
+
@@ -9,9 +9,90 @@ for the threshold signature scheme.
 import hashlib
 import secrets
 import numpy as np
+from collections import OrderedDict
+from functools import cached_property
 from typing import Tuple, Optional
-from ..crypto.polynomials import Polynomial, PolynomialVector
-from ..utils.constants import Q, N, get_params, DEFAULT_SECURITY_LEVEL
+from ..crypto.polynomials import Polynomial, PolynomialVector, _reduce_once
+from ..crypto.ntt import ntt, intt, pointwise_mul_acc
+from ..utils.constants import (Q, N, get_params, DEFAULT_SECURITY_LEVEL,
+                               VERIFY_CACHE_SIZE, SIGN_BATCH_SIZE)
+
+
+def _domain_hash(tag: bytes, *parts: bytes, digest_size: int = 32) -> bytes:
+    """
+    Hash data for internal, non-standardized purposes.
+    
+    Uses BLAKE2b with the tag as personalization string, so different
+    internal uses never share an input space. Hashes fixed by the
+    Dilithium specification stay on SHAKE.
+    
+    Args:
+        tag: Domain separation tag of at most 16 bytes
+        *parts: Byte strings to hash, in order
+        digest_size: Output length in bytes
+        
+    Returns:
+        Digest of the concatenated parts
+    """
+    hasher = hashlib.blake2b(digest_size=digest_size, person=tag)
+    for part in parts:
+        hasher.update(part)
+    return hasher.digest()
+
+
+def _matrix_coeffs(A: np.ndarray) -> np.ndarray:
+    """
+    Coefficient tensor of a polynomial matrix.
+    
+    Args:
+        A: Coefficient tensor of shape (k, l, N), or a legacy k x l
+            object array of Polynomial entries
+        
+    Returns:
+        int32 array of shape (k, l, N)
+    """
+    if A.dtype == object:
+        return np.array([[poly.coeffs for poly in row] for row in A], dtype=np.int32)
+    return A
+
+
+def _matrix_ntt(A: np.ndarray) -> np.ndarray:
+    """
+    Transform every entry of a polynomial matrix to the NTT domain.
+    
+    Args:
+        A: Coefficient tensor of shape (k, l, N)
+        
+    Returns:
+        Array of shape (k, l, N) with the NTT of each entry
+    """
+    return ntt(_matrix_coeffs(A))
+
+
+def _vector_ntt(v: PolynomialVector) -> np.ndarray:
+    """
+    Transform every polynomial of a vector to the NTT domain.
+    
+    Args:
+        v: Polynomial vector
+        
+    Returns:
+        Array of shape (len(v), N) with the NTT of each polynomial
+    """
+    return ntt(v.coeffs2d)
+
+
+def _vector_from_ntt(v_hat: np.ndarray) -> PolynomialVector:
+    """
+    Build a polynomial vector from NTT-domain rows.
+    
+    Args:
+        v_hat: Array of shape (length, N) in the NTT domain
+        
+    Returns:
+        Polynomial vector with coefficients in [0, Q)
+    """
+    return PolynomialVector._from_raw(intt(v_hat).astype(np.int32))
 
 
 class DilithiumKeyPair:
@@ -43,7 +124,7 @@ class DilithiumPublicKey:
         Initialize public key.
         
         Args:
-            A: Public matrix A (k x l matrix of polynomials)
+            A: Public matrix A as a (k, l, N) coefficient tensor
             t: Public vector t (k-dimensional polynomial vector)
             security_level: Security level (2, 3, or 5)
         """
@@ -51,6 +132,29 @@ class DilithiumPublicKey:
         self.t = t
         self.security_level = security_level
         self.params = get_params(security_level)
+    
+    @cached_property
+    def A_ntt(self) -> np.ndarray:
+        """
+        NTT of matrix A, computed once per public key.
+        
+        Returns:
+            Array of shape (k, l, N) with the NTT of each entry of A
+        """
+        return _matrix_ntt(self.A)
+    
+    @cached_property
+    def t_ntt(self) -> np.ndarray:
+        """NTT of public vector t, shape (k, N)."""
+        return _vector_ntt(self.t)
+    
+    @cached_property
+    def tr(self) -> bytes:
+        """Hash of the public key (A and t), computed once per key."""
+        hasher = hashlib.shake_256()
+        hasher.update(_matrix_coeffs(self.A).tobytes())
+        hasher.update(self.t.coeffs2d.tobytes())
+        return hasher.digest(64)
 
 
 class DilithiumPrivateKey:
@@ -59,7 +163,8 @@ class DilithiumPrivateKey:
     """
     
     def __init__(self, s1: PolynomialVector, s2: PolynomialVector,
-                 security_level: int = DEFAULT_SECURITY_LEVEL):
+                 security_level: int = DEFAULT_SECURITY_LEVEL,
+                 A: Optional[np.ndarray] = None):
         """
         Initialize private key.
         
@@ -67,11 +172,39 @@ class DilithiumPrivateKey:
             s1: Secret vector s1 (l-dimensional polynomial vector)
             s2: Secret vector s2 (k-dimensional polynomial vector)
             security_level: Security level (2, 3, or 5)
+            A: Public matrix A as a (k, l, N) coefficient tensor, needed to
+                compute commitments when signing
         """
         self.s1 = s1
         self.s2 = s2
         self.security_level = security_level
         self.params = get_params(security_level)
+        self.A = A
+    
+    @cached_property
+    def A_ntt(self) -> np.ndarray:
+        """
+        NTT of matrix A, computed once per private key.
+        
+        Returns:
+            Array of shape (k, l, N) with the NTT of each entry of A
+            
+        Raises:
+            ValueError: If the key was created without matrix A
+        """
+        if self.A is None:
+            raise ValueError("Private key does not include matrix A")
+        return _matrix_ntt(self.A)
+    
+    @cached_property
+    def s1_ntt(self) -> np.ndarray:
+        """NTT of secret vector s1, shape (l, N)."""
+        return _vector_ntt(self.s1)
+    
+    @cached_property
+    def s2_ntt(self) -> np.ndarray:
+        """NTT of secret vector s2, shape (k, N)."""
+        return _vector_ntt(self.s2)
 
 
 class DilithiumSignature:
@@ -120,6 +253,13 @@ class Dilithium:
         self.gamma1 = self.params['gamma1']
         self.gamma2 = self.params['gamma2']
         self.d = self.params['d']
+        
+        # Derived values used on every signing attempt and verification
+        self.z_bound = self.gamma1 - self.beta  # z must satisfy ||z|| < z_bound
+        self.alpha = 2 * self.gamma2            # Step between high-bit values
+        
+        # Results of recent verifications, keyed by message, key and signature
+        self._verify_cache: 'OrderedDict[bytes, bool]' = OrderedDict()
     
     def keygen(self, seed: Optional[bytes] = None) -> DilithiumKeyPair:
         """
@@ -145,13 +285,20 @@ class Dilithium:
         s2 = self._sample_s2(rho_prime)
         
         # Compute t = A * s1 + s2
-        t = self._matrix_vector_multiply(A, s1) + s2
+        A_ntt = _matrix_ntt(A)
+        s1_ntt = _vector_ntt(s1)
+        t = _vector_from_ntt(pointwise_mul_acc(A_ntt, s1_ntt)) + s2
         
         # Extract high-order bits of t
         t1 = self._high_bits(t)
         
         public_key = DilithiumPublicKey(A, t1, self.security_level)
-        private_key = DilithiumPrivateKey(s1, s2, self.security_level)
+        private_key = DilithiumPrivateKey(s1, s2, self.security_level, A)
+        
+        # Seed the cached NTT-domain forms computed above
+        public_key.A_ntt = A_ntt
+        private_key.A_ntt = A_ntt
+        private_key.s1_ntt = s1_ntt
         
         return DilithiumKeyPair(public_key, private_key)
     
@@ -174,33 +321,40 @@ class Dilithium:
         # Hash message
         mu = hashlib.shake_256(message).digest(64)
         
+        # The challenge depends only on mu, so it and c * s1 are the same
+        # for every attempt
+        c = self._generate_challenge(mu, None)
+        c_hat = ntt(c.coeffs)
+        cs1 = intt(c_hat * private_key.s1_ntt % Q)
+        
         # Initialize signing loop
         kappa = 0
         max_attempts = 1000  # Prevent infinite loops
+        batch_size = 1
         
         while kappa < max_attempts:
-            # Sample mask vector y
-            y = self._sample_y(randomness, kappa)
-            
-            # Compute w = A * y
-            w = self._matrix_vector_multiply(private_key.s1, y)  # Simplified
-            w1 = self._high_bits(w)
-            
-            # Generate challenge
-            c = self._generate_challenge(mu, w1)
-            
-            # Compute response z = y + c * s1
-            z = y + self._polynomial_vector_multiply(c, private_key.s1)
-            
-            # Check bounds
-            if self._check_z_bounds(z):
-                # Compute hint h
-                h = self._compute_hint(w, z, private_key.s2, c)
+            # Sample a batch of mask vectors y, tried in kappa order. Most
+            # signatures succeed on the first attempt, so batches start at
+            # one and only grow after rejections.
+            batch = min(batch_size, max_attempts - kappa)
+            Y = self._sample_y_batch(randomness, kappa, batch)
+            kappa += batch
+            batch_size = min(2 * batch_size, SIGN_BATCH_SIZE)
+            
+            # Compute responses z = y + c * s1 and their norms
+            Z = _reduce_once(Y + cs1).astype(np.int32)
+            # Z lies in [0, Q), so min(Z, Q - Z) is the centered magnitude
+            norms = np.minimum(Z, Q - Z).max(axis=(1, 2))
+            
+            # Reject on z before paying for w = A * y and the hint, which
+            # are only needed for attempts that pass
+            for b in np.flatnonzero(norms < self.z_bound):
+                w = self._matrix_vector_multiply_ntt(
+                    private_key.A_ntt, PolynomialVector._from_raw(Y[b]))
+                h = self._compute_hint(w, private_key.s2_ntt, c_hat)
                 
                 if self._check_h_bounds(h):
-                    return DilithiumSignature(z, h, c)
-            
-            kappa += 1
+                    return DilithiumSignature(PolynomialVector._from_raw(Z[b]), h, c)
         
         raise RuntimeError("Failed to generate signature after maximum attempts")
     
@@ -209,11 +363,48 @@ class Dilithium:
         """
         Verify a Dilithium signature.
         
+        Results are remembered for the most recent VERIFY_CACHE_SIZE
+        (message, public key, signature) combinations, so repeated
+        verifications of the same signature return immediately.
+        
         Args:
             message: Original message
             signature: Signature to verify
             public_key: Public key for verification
             
+        Returns:
+            True if signature is valid, False otherwise
+        """
+        try:
+            # Hash message
+            mu = hashlib.shake_256(message).digest(64)
+            cache_key = self._verify_cache_key(mu, signature, public_key)
+        except Exception:
+            return False
+        
+        cached = self._verify_cache.get(cache_key)
+        if cached is not None:
+            self._verify_cache.move_to_end(cache_key)
+            return cached
+        
+        result = self._verify_mu(mu, signature, public_key)
+        
+        self._verify_cache[cache_key] = result
+        if len(self._verify_cache) > VERIFY_CACHE_SIZE:
+            self._verify_cache.popitem(last=False)
+        
+        return result
+    
+    def _verify_mu(self, mu: bytes, signature: DilithiumSignature,
+                   public_key: DilithiumPublicKey) -> bool:
+        """
+        Verify a signature against an already hashed message.
+        
+        Args:
+            mu: Message hash
+            signature: Signature to verify
+            public_key: Public key for verification
+            
         Returns:
             True if signature is valid, False otherwise
         """
@@ -222,9 +413,6 @@ class Dilithium:
             if not self._check_signature_bounds(signature):
                 return False
             
-            # Hash message
-            mu = hashlib.shake_256(message).digest(64)
-            
             # Recompute w'
             w_prime = self._recompute_w(signature, public_key)
             
@@ -240,6 +428,28 @@ class Dilithium:
         except Exception:
             return False
     
+    def _verify_cache_key(self, mu: bytes, signature: DilithiumSignature,
+                          public_key: DilithiumPublicKey) -> bytes:
+        """
+        Build the verification cache key.
+        
+        Args:
+            mu: Message hash
+            signature: Signature being verified
+            public_key: Public key for verification
+            
+        Returns:
+            16-byte digest binding message, public key and signature
+        """
+        parts = [mu, public_key.tr]
+        
+        components = (signature.z.coeffs2d, signature.h.coeffs2d, signature.c.coeffs)
+        for component in components:
+            # Shape and dtype keep differently sized components from colliding
+            parts.append(repr((component.dtype.str, component.shape)).encode())
+            parts.append(component.tobytes())
+        return _domain_hash(b'verify_cache', *parts, digest_size=16)
+    
     def _expand_seed(self, seed: bytes) -> Tuple[bytes, bytes, bytes]:
         """
         Expand seed into rho, rho_prime, and K.
@@ -264,33 +474,45 @@ class Dilithium:
             rho: Seed for matrix generation
             
         Returns:
-            k x l matrix of polynomials
+            Coefficient tensor of shape (k, l, N)
         """
-        A = np.empty((self.k, self.l), dtype=object)
+        A = np.empty((self.k, self.l, N), dtype=np.int32)
+        
+        # Absorb rho once and clone the sponge for each entry's stream
+        base_xof = hashlib.shake_128(rho)
         
         for i in range(self.k):
             for j in range(self.l):
                 # Generate polynomial A[i,j] from rho, i, j
-                seed = rho + i.to_bytes(1, 'little') + j.to_bytes(1, 'little')
-                poly_coeffs = self._sample_uniform(seed)
-                A[i, j] = Polynomial(poly_coeffs)
+                xof = base_xof.copy()
+                xof.update(i.to_bytes(1, 'little') + j.to_bytes(1, 'little'))
+                A[i, j] = self._sample_uniform(xof)
         
         return A
     
-    def _sample_uniform(self, seed: bytes) -> np.ndarray:
+    def _sample_uniform(self, xof) -> np.ndarray:
         """
-        Sample uniform polynomial from seed.
+        Sample uniform polynomial from an extendable-output function.
         
         Args:
-            seed: Seed for sampling
+            xof: SHAKE-128 object that has absorbed the seed
             
         Returns:
             Array of polynomial coefficients
         """
-        # Simplified uniform sampling
-        hash_output = hashlib.shake_256(seed).digest(N * 4)
-        coeffs = np.frombuffer(hash_output, dtype=np.uint32)[:N] % Q
-        return coeffs.astype(np.int32)
+        # Rejection sampling on 23-bit little-endian values, as in the spec.
+        # Five SHAKE-128 blocks give 280 candidates; a longer digest extends
+        # the same stream if too many are rejected.
+        num_bytes = 5 * 168
+        while True:
+            stream = np.frombuffer(xof.digest(num_bytes), dtype=np.uint8)
+            fields = stream[:len(stream) // 3 * 3].reshape(-1, 3).astype(np.int32)
+            candidates = (fields[:, 0] | (fields[:, 1] << 8)
+                          | ((fields[:, 2] & 0x7F) << 16))
+            accepted = candidates[candidates < Q]
+            if len(accepted) >= N:
+                return accepted[:N]
+            num_bytes *= 2
     
     def _sample_s1(self, rho_prime: bytes) -> PolynomialVector:
         """
@@ -302,12 +524,7 @@ class Dilithium:
         Returns:
             Secret vector s1
         """
-        polys = []
-        for i in range(self.l):
-            seed = rho_prime + b's1' + i.to_bytes(1, 'little')
-            coeffs = self._sample_eta(seed)
-            polys.append(Polynomial(coeffs))
-        return PolynomialVector(polys)
+        return PolynomialVector._from_raw(self._sample_eta(rho_prime + b's1', self.l))
     
     def _sample_s2(self, rho_prime: bytes) -> PolynomialVector:
         """
@@ -319,28 +536,45 @@ class Dilithium:
         Returns:
             Secret vector s2
         """
-        polys = []
-        for i in range(self.k):
-            seed = rho_prime + b's2' + i.to_bytes(1, 'little')
-            coeffs = self._sample_eta(seed)
-            polys.append(Polynomial(coeffs))
-        return PolynomialVector(polys)
+        return PolynomialVector._from_raw(self._sample_eta(rho_prime + b's2', self.k))
     
-    def _sample_eta(self, seed: bytes) -> np.ndarray:
+    def _sample_eta(self, seed: bytes, rows: int) -> np.ndarray:
         """
-        Sample polynomial with coefficients in [-eta, eta].
+        Sample polynomials with coefficients in [-eta, eta].
+        
+        All rows come from one SHAKE-256 stream. Each byte yields two
+        4-bit candidates, low nibble first, and rejection sampling as in
+        the spec keeps the distribution uniform: for eta = 2 nibbles
+        below 15 map to 2 - (t mod 5), for eta = 4 nibbles below 9 map
+        to 4 - t.
         
         Args:
             seed: Seed for sampling
+            rows: Number of polynomials to sample
             
         Returns:
-            Array of polynomial coefficients
-        """
-        # Simplified eta sampling
-        hash_output = hashlib.shake_256(seed).digest(N)
-        coeffs = np.array([int(b) % (2 * self.eta + 1) - self.eta 
-                          for b in hash_output], dtype=np.int32)
-        return coeffs % Q
+            int32 array of shape (rows, N) with coefficients in [0, Q)
+        """
+        count = rows * N
+        xof = hashlib.shake_256(seed)
+        num_bytes = count
+        while True:
+            stream = np.frombuffer(xof.digest(num_bytes), dtype=np.uint8)
+            nibbles = np.stack([stream & 0x0F, stream >> 4], axis=-1).reshape(-1)
+            nibbles = nibbles.astype(np.int32)
+            if self.eta == 2:
+                accepted = nibbles[nibbles < 15]
+                accepted = 2 - accepted % 5
+            else:
+                accepted = nibbles[nibbles < 9]
+                accepted = 4 - accepted
+            if len(accepted) >= count:
+                break
+            num_bytes *= 2
+        
+        # Negative values use their positive representation mod Q
+        coeffs = accepted[:count].reshape(rows, N)
+        return np.where(coeffs < 0, coeffs + Q, coeffs).astype(np.int32)
     
     def _sample_y(self, randomness: bytes, kappa: int) -> PolynomialVector:
         """
@@ -353,12 +587,26 @@ class Dilithium:
         Returns:
             Mask vector y
         """
-        polys = []
-        for i in range(self.l):
-            seed = randomness + kappa.to_bytes(2, 'little') + i.to_bytes(1, 'little')
-            coeffs = self._sample_gamma1(seed)
-            polys.append(Polynomial(coeffs))
-        return PolynomialVector(polys)
+        prefix = randomness + kappa.to_bytes(2, 'little')
+        coeffs = np.stack([self._sample_gamma1(prefix + i.to_bytes(1, 'little'))
+                           for i in range(self.l)])
+        # Coefficients are already small signed int32 values
+        return PolynomialVector._from_raw(coeffs)
+    
+    def _sample_y_batch(self, randomness: bytes, kappa: int, count: int) -> np.ndarray:
+        """
+        Sample the mask vectors for several consecutive attempts.
+        
+        Args:
+            randomness: Source of randomness
+            kappa: Attempt counter of the first mask vector
+            count: Number of mask vectors
+            
+        Returns:
+            Coefficient array of shape (count, l, N)
+        """
+        return np.stack([self._sample_y(randomness, kappa + b).coeffs2d
+                         for b in range(count)])
     
     def _sample_gamma1(self, seed: bytes) -> np.ndarray:
         """
@@ -372,43 +620,78 @@ class Dilithium:
         """
         # More conservative gamma1 sampling to ensure bounds in threshold operations
         hash_output = hashlib.shake_256(seed).digest(N * 4)
-        coeffs = np.frombuffer(hash_output, dtype=np.uint32)[:N]
+        return self._gamma1_from_bytes(hash_output)
+    
+    def _gamma1_from_bytes(self, data: bytes) -> np.ndarray:
+        """
+        Map random bytes to mask coefficients, four bytes per coefficient.
+        
+        Args:
+            data: Random bytes, a multiple of four in length
+            
+        Returns:
+            One-dimensional array of coefficients in
+            [-gamma1 // 4, gamma1 // 4]
+        """
+        coeffs = np.frombuffer(data, dtype=np.uint32).astype(np.int64)
         
         # Use smaller range to account for threshold operations
         effective_gamma1 = self.gamma1 // 4  # Much more conservative
         
         # Map to range [-effective_gamma1, effective_gamma1]
         coeffs = coeffs % (2 * effective_gamma1 + 1) - effective_gamma1
-        coeffs = coeffs.astype(np.int32)
-        
-        # Ensure all coefficients are in the correct range
-        coeffs = np.clip(coeffs, -effective_gamma1, effective_gamma1)
-        
-        return coeffs
+        return coeffs.astype(np.int32)
     
     def _matrix_vector_multiply(self, A: np.ndarray, v: PolynomialVector) -> PolynomialVector:
         """
         Multiply matrix A by vector v.
         
+        Transforms A to the NTT domain first; callers that multiply by the
+        same matrix repeatedly should cache its NTT and use
+        _matrix_vector_multiply_ntt directly.
+        
         Args:
-            A: Matrix of polynomials
+            A: Coefficient tensor of shape (k, l, N)
             v: Polynomial vector
             
         Returns:
             Result of A * v
         """
-        # Simplified matrix-vector multiplication
-        result_polys = []
-        rows, cols = A.shape
+        return self._matrix_vector_multiply_ntt(_matrix_ntt(A), v)
+    
+    def _matrix_vector_multiply_ntt(self, A_ntt: np.ndarray,
+                                    v: PolynomialVector) -> PolynomialVector:
+        """
+        Multiply matrix A by vector v using the precomputed NTT of A.
+        
+        Products are accumulated in the NTT domain, so only one inverse
+        transform is needed per output polynomial.
+        
+        Args:
+            A_ntt: NTT of matrix A with shape (k, l, N)
+            v: Polynomial vector of length l
+            
+        Returns:
+            Result of A * v
+        """
+        return _vector_from_ntt(pointwise_mul_acc(A_ntt, _vector_ntt(v)))
+    
+    def _decompose(self, r: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Split coefficients into high and low parts in one pass.
         
-        for i in range(rows):
-            result_poly = Polynomial.zero()
-            for j in range(cols):
-                if j < len(v):
-                    result_poly = result_poly + A[i, j] * v[j]
-            result_polys.append(result_poly)
+        Every coefficient is written as r = r1 * 2 * gamma2 + r0 with
+        r0 in [-gamma2, gamma2).
         
-        return PolynomialVector(result_polys)
+        Args:
+            r: Coefficient array of any shape
+            
+        Returns:
+            Tuple of (r1, r0) arrays with the shape of r
+        """
+        r1 = (r + self.gamma2) // self.alpha
+        r0 = r - r1 * self.alpha
+        return r1, r0
     
     def _high_bits(self, v: PolynomialVector) -> PolynomialVector:
         """
@@ -421,11 +704,8 @@ class Dilithium:
             High-order bits
         """
         # Simplified high bits extraction
-        result_polys = []
-        for poly in v.polys:
-            high_coeffs = (poly.coeffs + self.gamma2) // (2 * self.gamma2)
-            result_polys.append(Polynomial(high_coeffs))
-        return PolynomialVector(result_polys)
+        r1, _ = self._decompose(v.coeffs2d)
+        return PolynomialVector._from_raw(r1)
     
     def _generate_challenge(self, mu: bytes, w1: PolynomialVector) -> Polynomial:
         """
@@ -438,18 +718,35 @@ class Dilithium:
         Returns:
             Challenge polynomial
         """
-        # Simplified challenge generation
-        seed = mu + b'challenge'
-        coeffs = np.zeros(N, dtype=np.int32)
+        # The seed depends only on mu: threshold signers derive the challenge
+        # from their own partial commitments, so binding w1 here would give
+        # each signer a different challenge.
+        xof = hashlib.shake_256(mu + b'challenge')
+        num_bytes = 8 + 3 * self.tau
+        stream = xof.digest(num_bytes)
         
-        # Sample tau positions for ±1 coefficients
-        hash_output = hashlib.shake_256(seed).digest(self.tau * 2)
-        for i in range(self.tau):
-            pos = hash_output[i * 2] % N
-            sign = 1 if hash_output[i * 2 + 1] % 2 == 0 else -1
-            coeffs[pos] = sign
+        # Sign bits come from the first 8 bytes, as in SampleInBall
+        bits = np.unpackbits(np.frombuffer(stream[:8], dtype=np.uint8),
+                             bitorder='little')[:self.tau]
+        signs = 1 - 2 * bits.astype(np.int32)
         
-        return Polynomial(coeffs)
+        # Fisher-Yates placement with rejection gives exactly tau nonzeros
+        coeffs = np.zeros(N, dtype=np.int32)
+        pos = 8
+        for k, i in enumerate(range(N - self.tau, N)):
+            while True:
+                if pos == len(stream):
+                    num_bytes *= 2
+                    stream = xof.digest(num_bytes)
+                j = stream[pos]
+                pos += 1
+                if j <= i:
+                    break
+            coeffs[i] = coeffs[j]
+            coeffs[j] = signs[k]
+        
+        # Entries are already -1, 0 or 1 in int32
+        return Polynomial._from_raw(coeffs)
     
     def _polynomial_vector_multiply(self, c: Polynomial, v: PolynomialVector) -> PolynomialVector:
         """
@@ -462,10 +759,23 @@ class Dilithium:
         Returns:
             Result of c * v
         """
-        result_polys = []
-        for poly in v.polys:
-            result_polys.append(c * poly)
-        return PolynomialVector(result_polys)
+        # Transform c once and reuse it for every polynomial of v
+        c_hat = ntt(c.coeffs)
+        return _vector_from_ntt(c_hat * _vector_ntt(v) % Q)
+    
+    def _polynomial_vector_multiply_ntt(self, c: Polynomial,
+                                        v_ntt: np.ndarray) -> PolynomialVector:
+        """
+        Multiply polynomial c by a vector given in the NTT domain.
+        
+        Args:
+            c: Polynomial
+            v_ntt: NTT of the polynomial vector, shape (length, N)
+            
+        Returns:
+            Result of c * v
+        """
+        return _vector_from_ntt(ntt(c.coeffs) * v_ntt % Q)
     
     def _check_z_bounds(self, z: PolynomialVector) -> bool:
         """
@@ -477,26 +787,35 @@ class Dilithium:
         Returns:
             True if bounds are satisfied
         """
-        return z.norm_infinity() < self.gamma1 - self.beta
+        return z.norm_infinity() < self.z_bound
     
-    def _compute_hint(self, w: PolynomialVector, z: PolynomialVector,
-                     s2: PolynomialVector, c: Polynomial) -> PolynomialVector:
+    def _compute_hint(self, w: PolynomialVector, s2_ntt: np.ndarray,
+                      c_hat: np.ndarray) -> PolynomialVector:
         """
         Compute hint vector h.
         
+        Gives the same result as _make_hint(w - c * s2, w) from a single
+        decomposition of w, without forming w - c * s2 as a vector.
+        
         Args:
             w: Vector w
-            z: Response vector z
-            s2: Secret vector s2
-            c: Challenge polynomial
+            s2_ntt: NTT of secret vector s2, shape (k, N)
+            c_hat: NTT of the challenge polynomial
             
         Returns:
             Hint vector h
         """
-        # Simplified hint computation
-        cs2 = self._polynomial_vector_multiply(c, s2)
-        w_minus_cs2 = w - cs2
-        return self._make_hint(w_minus_cs2, w)
+        cs2 = intt(c_hat * s2_ntt % Q)
+        cs2 = np.where(cs2 > Q // 2, cs2 - Q, cs2)
+        _, w0 = self._decompose(w.coeffs2d)
+        r0 = w0 - cs2
+        # Without wrap-around, the high bits change exactly when the low
+        # part leaves [-gamma2, gamma2). When w - c * s2 leaves [0, Q), the
+        # reduced value lands at the other end of the range, so its high
+        # bits always differ from those of w.
+        r = w.coeffs2d - cs2
+        hint = (r0 < -self.gamma2) | (r0 >= self.gamma2) | (r < 0) | (r >= Q)
+        return PolynomialVector._from_raw(hint.astype(np.int32))
     
     def _make_hint(self, v1: PolynomialVector, v2: PolynomialVector) -> PolynomialVector:
         """
@@ -509,13 +828,10 @@ class Dilithium:
         Returns:
             Hint vector
         """
-        # Simplified hint creation
-        result_polys = []
-        for p1, p2 in zip(v1.polys, v2.polys):
-            hint_coeffs = np.zeros(N, dtype=np.int32)
-            # Simplified hint logic
-            result_polys.append(Polynomial(hint_coeffs))
-        return PolynomialVector(result_polys)
+        # Flag coefficients whose high bits differ
+        r1_a, _ = self._decompose(v1.coeffs2d)
+        r1_b, _ = self._decompose(v2.coeffs2d)
+        return PolynomialVector._from_raw((r1_a != r1_b).astype(np.int32))
     
     def _check_h_bounds(self, h: PolynomialVector) -> bool:
         """
@@ -540,7 +856,7 @@ class Dilithium:
         Returns:
             True if bounds are satisfied
         """
-        return (signature.z.norm_infinity() < self.gamma1 - self.beta and
+        return (signature.z.norm_infinity() < self.z_bound and
                 signature.c.norm_infinity() <= self.tau)
     
     def _recompute_w(self, signature: DilithiumSignature,
@@ -556,8 +872,8 @@ class Dilithium:
             Recomputed w vector
         """
         # w = A * z - c * t * 2^d
-        Az = self._matrix_vector_multiply(public_key.A, signature.z)
-        ct = self._polynomial_vector_multiply(signature.c, public_key.t)
+        Az = self._matrix_vector_multiply_ntt(public_key.A_ntt, signature.z)
+        ct = self._polynomial_vector_multiply_ntt(signature.c, public_key.t_ntt)
         ct_scaled = ct * (2 ** self.d)
         return Az - ct_scaled
     
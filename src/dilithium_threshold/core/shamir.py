@@ -7,35 +7,174 @@ Dilithium algorithm, enabling threshold signatures without intermediate
 secret reconstruction.
 """
 
+import hashlib
 import numpy as np
-from typing import List, Tuple, Dict, Optional
+from functools import lru_cache, cached_property
+from typing import List, Tuple, Dict, Optional, Union
 import secrets
 from ..crypto.polynomials import Polynomial, PolynomialVector
-from ..utils.constants import Q, N, validate_threshold_config
+from ..crypto.ntt import ntt
+from ..utils.constants import (Q, N, DEFAULT_PARAMS, LAGRANGE_CACHE_SIZE,
+                               validate_threshold_config)
+
+
+def _batch_mod_inverse(values: List[int]) -> List[int]:
+    """
+    Invert several nonzero values modulo Q with a single exponentiation.
+    
+    Uses Montgomery's trick: invert the product of all values once, then
+    recover each inverse from the prefix products.
+    
+    Args:
+        values: Values to invert, all nonzero modulo Q
+        
+    Returns:
+        Inverse of each value modulo Q, in the same order
+    """
+    prefix = [1]
+    for value in values:
+        prefix.append(prefix[-1] * value % Q)
+    
+    # Built-in modular inverse (extended Euclid in C)
+    inverse = pow(prefix[-1], -1, Q)
+    
+    inverses = [0] * len(values)
+    for i in range(len(values) - 1, -1, -1):
+        inverses[i] = inverse * prefix[i] % Q
+        inverse = inverse * values[i] % Q
+    return inverses
+
+
+def _lagrange_denominators(xs: List[int]) -> List[int]:
+    """
+    Denominators prod_{j != i} (x_i - x_j) mod Q of the Lagrange basis.
+    
+    Args:
+        xs: Distinct interpolation points
+        
+    Returns:
+        Denominator of each basis polynomial, in the order of xs
+    """
+    denominators = []
+    for i, xi in enumerate(xs):
+        denominator = 1
+        # Skip x_i by slicing rather than testing i != j on every step
+        for xj in xs[:i] + xs[i + 1:]:
+            denominator = denominator * (xi - xj) % Q
+        denominators.append(denominator)
+    return denominators
+
+
+def _lagrange_numerators(xs: List[int], x: int) -> List[int]:
+    """
+    Numerators prod_{j != i} (x - x_j) mod Q of the Lagrange basis at x.
+    
+    Built from prefix and suffix products in O(n) multiplications,
+    without any division.
+    
+    Args:
+        xs: Distinct interpolation points
+        x: Evaluation point
+        
+    Returns:
+        Numerator of each basis polynomial, in the order of xs
+    """
+    n = len(xs)
+    prefix = [1] * (n + 1)
+    suffix = [1] * (n + 1)
+    for i in range(n):
+        prefix[i + 1] = prefix[i] * (x - xs[i]) % Q
+        suffix[n - 1 - i] = suffix[n - i] * (x - xs[n - 1 - i]) % Q
+    return [prefix[i] * suffix[i + 1] % Q for i in range(n)]
+
+
+@lru_cache(maxsize=LAGRANGE_CACHE_SIZE)
+def _lagrange_coefficients(participant_ids: Tuple[int, ...]) -> Tuple[int, ...]:
+    """
+    Compute Lagrange coefficients for interpolation at x = 0.
+    
+    The coefficients depend only on which participants take part, so
+    they are cached per participant set and reused for every coefficient
+    that is reconstructed from that set. The cache keeps the most
+    recently used LAGRANGE_CACHE_SIZE sets, so iterating over many
+    signer sets cannot grow it without bound.
+    
+    Args:
+        participant_ids: Participant identifiers (x coordinates) in share order
+        
+    Returns:
+        Lagrange coefficient modulo Q for each participant, in the same order
+    """
+    xs = list(participant_ids)
+    numerators = _lagrange_numerators(xs, 0)
+    inverses = _batch_mod_inverse(_lagrange_denominators(xs))
+    return tuple(n * inv % Q for n, inv in zip(numerators, inverses))
 
 
 class ShamirShare:
     """
     Represents a share in the adapted Shamir secret sharing scheme.
     
-    Each share contains the participant ID and the polynomial vector
-    representing their portion of the secret.
+    Each share contains the participant ID and their portion of the secret,
+    stored as a contiguous (length, N) int32 coefficient matrix with one row
+    per polynomial.
     """
     
-    def __init__(self, participant_id: int, share_vector: PolynomialVector):
+    def __init__(self, participant_id: int,
+                 share_vector: Union[PolynomialVector, np.ndarray]):
         """
         Initialize a Shamir share.
         
         Args:
             participant_id: Unique identifier for the participant (1-based)
-            share_vector: Polynomial vector representing the share
+            share_vector: Polynomial vector representing the share, or its
+                coefficient matrix of shape (length, N)
         """
         if participant_id < 1:
             raise ValueError("Participant ID must be positive")
         
         self.participant_id = participant_id
         self.share_vector = share_vector
-        self.vector_length = len(share_vector)
+    
+    @property
+    def share_vector(self) -> PolynomialVector:
+        """
+        Share as a polynomial vector backed by the coefficient matrix.
+        
+        The vector shares memory with share_matrix, so in-place edits
+        change the share, as they did when share_vector was a plain
+        attribute.
+        """
+        return PolynomialVector._from_raw(self.share_matrix)
+    
+    @share_vector.setter
+    def share_vector(self, share_vector: Union[PolynomialVector, np.ndarray]):
+        """
+        Replace the share with a polynomial vector or coefficient matrix.
+        
+        Args:
+            share_vector: Polynomial vector representing the share, or its
+                coefficient matrix of shape (length, N)
+        """
+        if isinstance(share_vector, PolynomialVector):
+            share_matrix = share_vector.coeffs2d.copy()
+        else:
+            share_matrix = np.asarray(share_vector, dtype=np.int32)
+        
+        self.share_matrix = share_matrix
+        self.vector_length = share_matrix.shape[0]
+        # Drop the NTT cached for the previous coefficients
+        self.__dict__.pop('share_ntt', None)
+    
+    @cached_property
+    def share_ntt(self) -> np.ndarray:
+        """
+        NTT of each row of the share matrix, computed once per share.
+        
+        Assigning share_vector resets it. In-place edits made after it
+        was computed are not tracked.
+        """
+        return ntt(self.share_matrix)
     
     def __repr__(self) -> str:
         return f"ShamirShare(id={self.participant_id}, length={self.vector_length})"
@@ -45,7 +184,7 @@ class ShamirShare:
         if not isinstance(other, ShamirShare):
             return False
         return (self.participant_id == other.participant_id and 
-                self.share_vector == other.share_vector)
+                np.array_equal(self.share_matrix, other.share_matrix))
 
 
 class AdaptedShamirSSS:
@@ -74,6 +213,16 @@ class AdaptedShamirSSS:
         self.threshold = threshold
         self.participants = participants
         self.participant_ids = list(range(1, participants + 1))
+        
+        # Powers pid^d mod Q used to evaluate every Shamir polynomial
+        self._vandermonde = np.ones((participants, threshold), dtype=np.int64)
+        ids = np.array(self.participant_ids, dtype=np.int64)
+        for d in range(1, threshold):
+            self._vandermonde[:, d] = self._vandermonde[:, d - 1] * ids % Q
+        
+        # Weights for the first threshold participants, the signer set that
+        # reconstruct_secret uses when shares are passed in ID order
+        _lagrange_coefficients(tuple(self.participant_ids[:threshold]))
     
     def split_secret(self, secret_vector: PolynomialVector, seed: Optional[bytes] = None) -> List[ShamirShare]:
         """
@@ -83,58 +232,39 @@ class AdaptedShamirSSS:
         coefficient in that polynomial, we create a separate Shamir polynomial.
         This allows reconstruction without ever assembling the full secret.
         
+        All Shamir polynomials are held in one (length, N, threshold) tensor
+        and evaluated at every participant ID with a single product against
+        the Vandermonde matrix precomputed at construction. The result is
+        laid out as (participants, length, N), so each participant's share
+        is one contiguous slice of it.
+        
         Args:
             secret_vector: The polynomial vector to be shared
+            seed: Optional seed for deterministic coefficient generation
             
         Returns:
             List of shares, one for each participant
         """
         vector_length = len(secret_vector)
-        shares = []
         
-        # For each participant, we'll collect their share of each coefficient
-        participant_shares = {pid: [] for pid in self.participant_ids}
+        # Constant terms are the secret coefficients
+        secret_terms = secret_vector.coeffs2d.astype(np.int64).reshape(
+            vector_length, N, 1) % Q
         
-        # Process each polynomial in the vector
-        for poly_idx in range(vector_length):
-            polynomial = secret_vector[poly_idx]
-            
-            # Process each coefficient in the polynomial
-            for coeff_idx in range(N):
-                secret_coeff = polynomial.coeffs[coeff_idx]
-                
-                # Create Shamir polynomial for this coefficient
-                # Use deterministic seed if provided
-                coeff_seed = None
-                if seed is not None:
-                    import hashlib
-                    coeff_seed = hashlib.sha256(seed + poly_idx.to_bytes(4, 'big') + coeff_idx.to_bytes(4, 'big')).digest()
-                
-                shamir_poly = self._create_shamir_polynomial(secret_coeff, coeff_seed)
-                
-                # Evaluate polynomial at each participant's ID
-                for pid in self.participant_ids:
-                    share_value = self._evaluate_polynomial(shamir_poly, pid)
-                    participant_shares[pid].append((poly_idx, coeff_idx, share_value))
-        
-        # Organize shares into polynomial vectors for each participant
-        for pid in self.participant_ids:
-            share_polys = []
-            
-            for poly_idx in range(vector_length):
-                # Collect coefficients for this polynomial
-                coeffs = np.zeros(N, dtype=np.int32)
-                
-                for poly_i, coeff_i, value in participant_shares[pid]:
-                    if poly_i == poly_idx:
-                        coeffs[coeff_i] = value
-                
-                share_polys.append(Polynomial(coeffs))
-            
-            share_vector = PolynomialVector(share_polys)
-            shares.append(ShamirShare(pid, share_vector))
+        # Random higher-degree terms
+        random_terms = self._random_coefficients(
+            (vector_length, N, self.threshold - 1), seed)
+        
+        # Shamir polynomial coefficients [a0, a1, ..., a_{t-1}] per secret coefficient
+        shamir_polys = np.concatenate([secret_terms, random_terms], axis=-1)
         
-        return shares
+        # Evaluate every polynomial at every participant ID
+        evaluations = np.tensordot(self._vandermonde, shamir_polys, axes=([1], [2]))
+        np.remainder(evaluations, Q, out=evaluations)
+        share_tensor = evaluations.astype(np.int32)
+        
+        return [ShamirShare(pid, share_tensor[i])
+                for i, pid in enumerate(self.participant_ids)]
     
     def reconstruct_secret(self, shares: List[ShamirShare]) -> PolynomialVector:
         """
@@ -160,28 +290,7 @@ class AdaptedShamirSSS:
         if not all(share.vector_length == vector_length for share in active_shares):
             raise ValueError("All shares must have same vector length")
         
-        reconstructed_polys = []
-        
-        # Reconstruct each polynomial in the vector
-        for poly_idx in range(vector_length):
-            coeffs = np.zeros(N, dtype=np.int32)
-            
-            # Reconstruct each coefficient
-            for coeff_idx in range(N):
-                # Collect share values for this coefficient
-                points = []
-                for share in active_shares:
-                    x = share.participant_id
-                    y = share.share_vector[poly_idx].coeffs[coeff_idx]
-                    points.append((x, y))
-                
-                # Use Lagrange interpolation to reconstruct coefficient
-                reconstructed_coeff = self._lagrange_interpolation(points, 0)
-                coeffs[coeff_idx] = reconstructed_coeff % Q
-            
-            reconstructed_polys.append(Polynomial(coeffs))
-        
-        return PolynomialVector(reconstructed_polys)
+        return self._interpolate_at_zero(active_shares, slice(None))
     
     def partial_reconstruct(self, shares: List[ShamirShare], 
                           poly_indices: List[int]) -> PolynomialVector:
@@ -202,107 +311,115 @@ class AdaptedShamirSSS:
             raise ValueError(f"Need at least {self.threshold} shares")
         
         active_shares = shares[:self.threshold]
-        reconstructed_polys = []
+        return self._interpolate_at_zero(active_shares, poly_indices)
+    
+    def _interpolate_at_zero(self, shares: List[ShamirShare],
+                             poly_indices: Union[List[int], slice]) -> PolynomialVector:
+        """
+        Interpolate the selected polynomials of the secret at x = 0.
         
-        for poly_idx in poly_indices:
-            coeffs = np.zeros(N, dtype=np.int32)
-            
-            for coeff_idx in range(N):
-                points = []
-                for share in active_shares:
-                    x = share.participant_id
-                    y = share.share_vector[poly_idx].coeffs[coeff_idx]
-                    points.append((x, y))
-                
-                reconstructed_coeff = self._lagrange_interpolation(points, 0)
-                coeffs[coeff_idx] = reconstructed_coeff % Q
+        Lagrange coefficients depend only on the participant IDs, so they
+        are computed once and applied to all coefficients in one product.
+        
+        Args:
+            shares: Shares to interpolate from
+            poly_indices: Indices of polynomials to reconstruct, or a slice;
+                a slice selects rows without copying each share matrix
             
-            reconstructed_polys.append(Polynomial(coeffs))
+        Returns:
+            Polynomial vector containing the requested polynomials
+        """
+        participant_ids = tuple(share.participant_id for share in shares)
+        lambdas = np.array(_lagrange_coefficients(participant_ids), dtype=np.int64)
+        
+        # Share values, shape (shares, polynomials, N); stacked once as int32,
+        # the product with the int64 weights accumulates in int64
+        values = np.stack([share.share_matrix[poly_indices] for share in shares])
         
-        return PolynomialVector(reconstructed_polys)
+        coeffs = np.tensordot(lambdas, values, axes=1)
+        np.remainder(coeffs, Q, out=coeffs)
+        return PolynomialVector._from_raw(coeffs.astype(np.int32))
     
-    def _create_shamir_polynomial(self, secret: int, seed: Optional[bytes] = None) -> List[int]:
+    def _random_coefficients(self, shape: Tuple[int, ...],
+                             seed: Optional[bytes] = None) -> np.ndarray:
         """
-        Create a Shamir polynomial with given secret as constant term.
+        Sample higher-degree coefficients for Shamir polynomials.
         
         Args:
-            secret: The secret value (constant term)
+            shape: Shape of the coefficient array to sample
             seed: Optional seed for deterministic coefficient generation
             
         Returns:
-            List of polynomial coefficients [a0, a1, ..., a_{t-1}]
-            where a0 = secret
+            Array of coefficients modulo Q with the requested shape
         """
-        coeffs = [secret]
-        
-        # Generate random coefficients for higher degree terms
-        # Use secure range to prevent cryptographic vulnerabilities
-        # while maintaining signature bounds in Dilithium
-        
-        # Calculate secure coefficient range based on security level
-        from dilithium_threshold.utils.constants import get_params
-        params = get_params()  # Use default security level
-        gamma1 = params['gamma1']
+        # Calculate secure coefficient range based on the default security
+        # level; the table is only read, so no per-call copy is needed
+        gamma1 = DEFAULT_PARAMS['gamma1']
         
         # Secure range: large enough for cryptographic security,
         # small enough to not violate Dilithium bounds
         min_coeff = 50  # Minimum for security
         max_coeff = min(gamma1 // 32, 2000)  # Conservative bound
         
-        if seed is not None:
-            # Deterministic generation using seed
-            import hashlib
-            for i in range(self.threshold - 1):
-                # Create unique seed for each coefficient
-                coeff_seed = hashlib.sha256(seed + i.to_bytes(4, 'big')).digest()
-                coeff_value = int.from_bytes(coeff_seed[:4], 'big')
-                coeff = min_coeff + (coeff_value % (max_coeff - min_coeff + 1))
-                
-                # Randomly make negative for more diversity
-                if (coeff_value >> 31) & 1:
-                    coeff = -coeff
-                
-                # Ensure positive modular representation
-                if coeff < 0:
-                    coeff += Q
-                coeffs.append(coeff)
-        else:
-            # Random generation
-            for _ in range(self.threshold - 1):
-                # Generate secure coefficient in range [min_coeff, max_coeff]
-                coeff = secrets.randbelow(max_coeff - min_coeff + 1) + min_coeff
-                
-                # Randomly make negative for more diversity
-                if secrets.randbits(1):
-                    coeff = -coeff
-                
-                # Ensure positive modular representation
-                if coeff < 0:
-                    coeff += Q
-                coeffs.append(coeff)
-        
-        return coeffs
+        span = max_coeff - min_coeff + 1
+        # Reject the top partial block of 31-bit magnitudes so % span is unbiased
+        limit = (1 << 31) // span * span
+        
+        count = int(np.prod(shape))
+        num_bytes = 4 * count
+        random_bytes = b''
+        # SHAKE-128 has the larger rate, so it squeezes bulk output faster
+        xof = hashlib.shake_128(seed + b'shamir_coefficients') if seed is not None else None
+        while True:
+            if xof is not None:
+                # Deterministic generation using seed; longer digests extend the stream
+                random_bytes = xof.digest(num_bytes)
+            else:
+                random_bytes += secrets.token_bytes(num_bytes - len(random_bytes))
+            
+            values = np.frombuffer(random_bytes, dtype='>u4').astype(np.int64)
+            values = values[(values & 0x7FFFFFFF) < limit]
+            if len(values) >= count:
+                break
+            num_bytes += 4 * (count - len(values)) + 64
+        
+        values = values[:count].reshape(shape)
+        coeffs = min_coeff + (values & 0x7FFFFFFF) % span
+        
+        # Top bit picks the sign; negative values use their positive representation mod Q
+        return np.where(values >> 31 == 1, Q - coeffs, coeffs)
     
-    def _evaluate_polynomial(self, poly_coeffs: List[int], x: int) -> int:
+    def _evaluate_polynomial(self, poly_coeffs: Union[List[int], np.ndarray],
+                             x: int) -> Union[int, np.ndarray]:
         """
-        Evaluate polynomial at given point using Horner's method.
+        Evaluate polynomials at given point using Horner's method.
         
         Args:
-            poly_coeffs: Polynomial coefficients [a0, a1, ..., a_{t-1}]
+            poly_coeffs: Polynomial coefficients [a0, a1, ..., a_{t-1}], or an
+                array of shape (..., t) holding one polynomial per leading index
             x: Point at which to evaluate
             
         Returns:
-            Polynomial value at x, modulo Q
+            Polynomial value at x modulo Q, or an array of values with the
+            leading shape of poly_coeffs
         """
-        result = 0
-        x_power = 1
+        x = x % Q
         
-        for coeff in poly_coeffs:
-            # Use int64 to prevent overflow
-            result = (result + int(coeff) * x_power) % Q
-            x_power = (x_power * x) % Q
+        if not isinstance(poly_coeffs, np.ndarray):
+            # A single polynomial: plain integers avoid NumPy call overhead
+            result = 0
+            for coeff in reversed(poly_coeffs):
+                result = (result * x + int(coeff)) % Q
+            return result
         
-        return result
+        coeffs = poly_coeffs.astype(np.int64) % Q
+        
+        # Values stay below Q, so result * x fits in int64
+        result = np.zeros(coeffs.shape[:-1], dtype=np.int64)
+        for d in range(coeffs.shape[-1] - 1, -1, -1):
+            result = (result * x + coeffs[..., d]) % Q
+        
+        return int(result) if result.ndim == 0 else result
     
     def _lagrange_interpolation(self, points: List[Tuple[int, int]], x: int) -> int:
         """
@@ -315,35 +432,26 @@ class AdaptedShamirSSS:
         Returns:
             Interpolated value at x, modulo Q
         """
-        result = 0
-        n = len(points)
+        xs = [xi for xi, _ in points]
         
-        for i in range(n):
-            xi, yi = points[i]
-            
-            # Compute Lagrange basis polynomial L_i(x)
-            numerator = 1
-            denominator = 1
-            
-            for j in range(n):
-                if i != j:
-                    xj, _ = points[j]
-                    numerator = (numerator * (x - xj)) % Q
-                    denominator = (denominator * (xi - xj)) % Q
-            
-            # Compute modular inverse of denominator
-            denominator_inv = self._mod_inverse(denominator, Q)
-            
-            # Add contribution of this basis polynomial
-            # Use int64 to prevent overflow
-            contribution = (int(yi) * int(numerator) * int(denominator_inv)) % Q
-            result = (result + contribution) % Q
+        if x == 0:
+            # Reconstruction case: reuse the weights cached per point set
+            weights = _lagrange_coefficients(tuple(xs))
+        else:
+            # One modular inversion for all basis polynomials
+            inverses = _batch_mod_inverse(_lagrange_denominators(xs))
+            weights = [n * inv % Q for n, inv in
+                       zip(_lagrange_numerators(xs, x), inverses)]
+        
+        result = 0
+        for (_, yi), weight in zip(points, weights):
+            result = (result + int(yi) * weight) % Q
         
         return result
     
     def _mod_inverse(self, a: int, m: int) -> int:
         """
-        Compute modular inverse of a modulo m using extended Euclidean algorithm.
+        Compute modular inverse of a modulo m.
         
         Args:
             a: Number to find inverse of
@@ -358,21 +466,11 @@ class AdaptedShamirSSS:
         if m == 1:
             return 0
         
-        # Extended Euclidean Algorithm
-        def extended_gcd(a: int, b: int) -> Tuple[int, int, int]:
-            if a == 0:
-                return b, 0, 1
-            gcd, x1, y1 = extended_gcd(b % a, a)
-            x = y1 - (b // a) * x1
-            y = x1
-            return gcd, x, y
-        
-        gcd, x, _ = extended_gcd(a % m, m)
-        
-        if gcd != 1:
+        # Built-in extended Euclid in C; about twice as fast as a^(Q-2) for Q
+        try:
+            return pow(a % m, -1, m)
+        except ValueError:
             raise ValueError(f"Modular inverse of {a} modulo {m} does not exist")
-        
-        return (x % m + m) % m
     
     def verify_shares(self, shares: List[ShamirShare]) -> bool:
         """
@@ -7,13 +7,17 @@ to enable threshold signatures without intermediate secret reconstruction.
 """
 
 import hashlib
+import itertools
+import math
 import secrets
 import numpy as np
-from typing import List, Tuple, Optional, Dict
-from ..crypto.polynomials import Polynomial, PolynomialVector
-from .dilithium import Dilithium, DilithiumPublicKey, DilithiumSignature
-from .shamir import AdaptedShamirSSS, ShamirShare
-from ..utils.constants import validate_threshold_config, DEFAULT_SECURITY_LEVEL, Q, N
+from typing import List, Optional, Dict
+from ..crypto.ntt import ntt, intt
+from ..crypto.polynomials import Polynomial, PolynomialVector, _reduce_once
+from .dilithium import Dilithium, DilithiumPublicKey, DilithiumSignature, _domain_hash
+from .shamir import AdaptedShamirSSS, ShamirShare, _lagrange_coefficients
+from ..utils.constants import (validate_threshold_config, DEFAULT_SECURITY_LEVEL, Q, N,
+                               LAGRANGE_PRECOMPUTE_LIMIT)
 
 
 class ThresholdKeyShare:
@@ -104,12 +108,28 @@ class ThresholdSignature:
         self.deterministic_seed = deterministic_seed
         
         # Initialize underlying schemes
-        self.dilithium = Dilithium(security_level)
+        self._dilithium = Dilithium(security_level)
         self.shamir_s1 = AdaptedShamirSSS(threshold, participants)
         self.shamir_s2 = AdaptedShamirSSS(threshold, participants)
         
         # Store participant IDs
         self.participant_ids = list(range(1, participants + 1))
+        
+        # Lagrange weights for every signer set in ID order, when there are
+        # few enough sets; combine_signatures then never inverts anything
+        if math.comb(participants, threshold) <= LAGRANGE_PRECOMPUTE_LIMIT:
+            for signer_set in itertools.combinations(self.participant_ids, threshold):
+                _lagrange_coefficients(signer_set)
+    
+    @property
+    def dilithium(self) -> Dilithium:
+        """
+        Dilithium instance for this scheme's security level.
+        
+        Reuse it for verifying combined signatures instead of
+        constructing a new Dilithium object per verification.
+        """
+        return self._dilithium
     
     def distributed_keygen(self, seed: Optional[bytes] = None) -> List[ThresholdKeyShare]:
         """
@@ -161,16 +181,7 @@ class ThresholdSignature:
         Returns:
             Partial signature from this participant
         """
-        if randomness is None:
-            if self.deterministic_seed is not None:
-                # Use deterministic seed for reproducible tests
-                hasher = hashlib.sha256()
-                hasher.update(self.deterministic_seed)
-                hasher.update(message)
-                hasher.update(key_share.participant_id.to_bytes(4, 'little'))
-                randomness = hasher.digest()
-            else:
-                randomness = secrets.token_bytes(32)
+        randomness = self._signing_randomness(message, key_share, randomness)
         
         # Hash message
         mu = hashlib.shake_256(message).digest(64)
@@ -186,7 +197,7 @@ class ThresholdSignature:
         # Note: This is simplified - in practice, we need coordination
         # between participants to compute the full commitment
         w_partial = self._compute_partial_commitment(
-            key_share.public_key.A, y_partial)
+            key_share.public_key.A_ntt, y_partial)
         
         # For now, use a simplified challenge generation
         # In practice, this requires coordination between participants
@@ -203,6 +214,57 @@ class ThresholdSignature:
             challenge=challenge
         )
     
+    def partial_sign_batch(self, message: bytes,
+                           key_shares: List[ThresholdKeyShare],
+                           randomness: Optional[bytes] = None) -> List[PartialSignature]:
+        """
+        Create partial signatures on one message for several key shares.
+        
+        Produces the same partial signatures as calling partial_sign for
+        each share, but hashes the message once and runs the NTTs, the
+        commitment product and the challenge product for all participants
+        as single NumPy operations over stacked arrays.
+        
+        Args:
+            message: Message to sign
+            key_shares: Key shares of the same public key
+            randomness: Optional randomness for deterministic signing,
+                used for every share as in partial_sign
+            
+        Returns:
+            Partial signatures, in the order of key_shares
+        """
+        if not key_shares:
+            return []
+        
+        mu = hashlib.shake_256(message).digest(64)
+        
+        # Mask vectors of all participants, shape (shares, l, N)
+        Y = np.stack([
+            self._sample_partial_y(self._derive_participant_randomness(
+                self._signing_randomness(message, share, randomness),
+                share.participant_id)).coeffs2d
+            for share in key_shares])
+        
+        # Partial commitments w = A * y for every participant at once
+        A_ntt = key_shares[0].public_key.A_ntt
+        W = intt(np.einsum('kln,bln->bkn', A_ntt, ntt(Y)) % Q).astype(np.int32)
+        commitments = [PolynomialVector._from_raw(w) for w in W]
+        challenges = [self._generate_partial_challenge(mu, w) for w in commitments]
+        
+        # Responses z = y + c * s1_share for every participant at once
+        C_hat = ntt(np.stack([c.coeffs for c in challenges]))
+        S1_hat = np.stack([share.s1_share.share_ntt for share in key_shares])
+        CS1 = intt(C_hat[:, None, :] * S1_hat % Q)
+        Z = _reduce_once(Y + CS1).astype(np.int32)
+        
+        return [PartialSignature(
+                    participant_id=share.participant_id,
+                    z_partial=PolynomialVector._from_raw(Z[b]),
+                    commitment=commitments[b],
+                    challenge=challenges[b])
+                for b, share in enumerate(key_shares)]
+    
     def combine_signatures(self, partial_signatures: List[PartialSignature],
                           public_key: DilithiumPublicKey) -> DilithiumSignature:
         """
@@ -226,7 +288,8 @@ class ThresholdSignature:
         
         # Verify all partial signatures use the same challenge
         challenge = partial_signatures[0].challenge
-        if not all(ps.challenge == challenge for ps in partial_signatures):
+        challenges = np.stack([ps.challenge.coeffs for ps in partial_signatures])
+        if not (challenges == challenges[0]).all():
             raise ValueError("All partial signatures must use the same challenge")
         
         # Use first threshold partial signatures
@@ -240,6 +303,37 @@ class ThresholdSignature:
         
         return DilithiumSignature(z, h, challenge)
     
+    def prepare_signer_set(self, participant_ids: List[int]) -> np.ndarray:
+        """
+        Precompute the Lagrange weights for a committee of signers.
+        
+        The weights at x = 0 depend only on which participants sign, so
+        they can be prepared as soon as the committee is known. The
+        result is cached, and combine_signatures reuses it whenever the
+        partial signatures arrive in the same participant order.
+        
+        Args:
+            participant_ids: IDs of the signing participants, in the order
+                their partial signatures will be combined
+            
+        Returns:
+            Lagrange coefficient modulo Q for each participant, as an
+            int64 array
+            
+        Raises:
+            ValueError: If the committee size does not equal the threshold,
+                or an ID is unknown or repeated
+        """
+        if len(participant_ids) != self.threshold:
+            raise ValueError(f"Need exactly {self.threshold} participant IDs")
+        if len(set(participant_ids)) != len(participant_ids):
+            raise ValueError("Participant IDs must be distinct")
+        if not all(pid in self.participant_ids for pid in participant_ids):
+            raise ValueError("Unknown participant ID")
+        
+        return np.array(_lagrange_coefficients(tuple(participant_ids)),
+                        dtype=np.int64)
+    
     def verify_partial_signature(self, message: bytes, 
                                 partial_sig: PartialSignature,
                                 key_share: ThresholdKeyShare) -> bool:
@@ -274,6 +368,72 @@ class ThresholdSignature:
         except Exception:
             return False
     
+    def verify_partial_signatures_batch(self, message: bytes,
+                                        partial_sigs: List[PartialSignature],
+                                        key_shares: List[ThresholdKeyShare]) -> List[bool]:
+        """
+        Verify several partial signatures on the same message at once.
+        
+        The message hash is computed once for the whole batch and the
+        bound check runs as a single pass over the stacked z vectors.
+        Each result equals verify_partial_signature for the same input.
+        
+        Args:
+            message: Original message
+            partial_sigs: Partial signatures to verify
+            key_shares: Key shares used for signing, one per partial signature
+            
+        Returns:
+            List with the verification result of each partial signature
+            
+        Raises:
+            ValueError: If the number of key shares does not match
+        """
+        if len(partial_sigs) != len(key_shares):
+            raise ValueError("Need one key share per partial signature")
+        if not partial_sigs:
+            return []
+        
+        # Hash message once for all signers
+        mu = hashlib.shake_256(message).digest(64)
+        
+        # Verify challenge consistency
+        results = []
+        for partial_sig in partial_sigs:
+            try:
+                expected_challenge = self._generate_partial_challenge(
+                    mu, partial_sig.commitment)
+                results.append(partial_sig.challenge == expected_challenge)
+            except Exception:
+                results.append(False)
+        
+        # Verify partial signature bounds for the whole batch
+        bounds = self._check_partial_bounds_batch(partial_sigs)
+        return [valid and bound_ok for valid, bound_ok in zip(results, bounds)]
+    
+    def _signing_randomness(self, message: bytes, key_share: ThresholdKeyShare,
+                            randomness: Optional[bytes]) -> bytes:
+        """
+        Resolve the base randomness for one partial signature.
+        
+        Args:
+            message: Message to sign
+            key_share: Participant's key share
+            randomness: Randomness supplied by the caller, if any
+            
+        Returns:
+            Caller randomness, seed-derived randomness in deterministic
+            mode, or fresh random bytes
+        """
+        if randomness is not None:
+            return randomness
+        if self.deterministic_seed is not None:
+            # Use deterministic seed for reproducible tests
+            return _domain_hash(
+                b'signing_rand', self.deterministic_seed, message,
+                key_share.participant_id.to_bytes(4, 'little'))
+        return secrets.token_bytes(32)
+    
     def _derive_participant_randomness(self, base_randomness: bytes,
                                      participant_id: int) -> bytes:
         """
@@ -286,11 +446,8 @@ class ThresholdSignature:
         Returns:
             Participant-specific randomness
         """
-        hasher = hashlib.sha256()
-        hasher.update(base_randomness)
-        hasher.update(participant_id.to_bytes(4, 'little'))
-        hasher.update(b'participant_randomness')
-        return hasher.digest()
+        return _domain_hash(b'participant_rand', base_randomness,
+                            participant_id.to_bytes(4, 'little'))
     
     def _sample_partial_y(self, randomness: bytes) -> PolynomialVector:
         """
@@ -302,28 +459,28 @@ class ThresholdSignature:
         Returns:
             Partial mask vector
         """
-        # Sample polynomials for this participant's portion
-        polys = []
-        for i in range(self.dilithium.l):
-            seed = randomness + i.to_bytes(1, 'little')
-            coeffs = self.dilithium._sample_gamma1(seed)
-            polys.append(Polynomial(coeffs))
+        # Squeeze all polynomials for this participant's portion from one stream
+        l = self.dilithium.l
+        stream = hashlib.shake_256(randomness).digest(l * N * 4)
+        coeffs = self.dilithium._gamma1_from_bytes(stream).reshape(l, N)
         
-        return PolynomialVector(polys)
+        # Coefficients are already small signed int32 values
+        return PolynomialVector._from_raw(coeffs)
     
-    def _compute_partial_commitment(self, A, y_partial: PolynomialVector) -> PolynomialVector:
+    def _compute_partial_commitment(self, A_ntt: np.ndarray,
+                                    y_partial: PolynomialVector) -> PolynomialVector:
         """
         Compute partial commitment w_partial.
         
         Args:
-            A: Public matrix
+            A_ntt: NTT of the public matrix, shape (k, l, N)
             y_partial: Partial mask vector
             
         Returns:
             Partial commitment
         """
         # Simplified partial commitment computation
-        return self.dilithium._matrix_vector_multiply(A, y_partial)
+        return self.dilithium._matrix_vector_multiply_ntt(A_ntt, y_partial)
     
     def _generate_partial_challenge(self, mu: bytes, 
                                   w_partial: PolynomialVector) -> Polynomial:
@@ -355,10 +512,7 @@ class ThresholdSignature:
         Returns:
             Result of c * share
         """
-        result_polys = []
-        for poly in share.share_vector.polys:
-            result_polys.append(challenge * poly)
-        return PolynomialVector(result_polys)
+        return self.dilithium._polynomial_vector_multiply_ntt(challenge, share.share_ntt)
     
     def _reconstruct_z_vector(self, partial_signatures: List[PartialSignature]) -> PolynomialVector:
         """
@@ -373,37 +527,22 @@ class ThresholdSignature:
         if not partial_signatures:
             raise ValueError("No partial signatures provided")
         
-        # Get vector length from first partial signature
-        vector_length = len(partial_signatures[0].z_partial)
+        # Lagrange coefficients depend only on the signer set
+        participant_ids = tuple(ps.participant_id for ps in partial_signatures)
+        lambdas = np.array(_lagrange_coefficients(participant_ids), dtype=np.int64)
         
-        # Reconstruct each polynomial in the vector
-        reconstructed_polys = []
+        # Interpolate every coefficient of every polynomial at once
+        z_shares = np.stack([ps.z_partial.coeffs2d for ps in partial_signatures])
+        z = np.tensordot(lambdas, z_shares, axes=1)
+        np.remainder(z, Q, out=z)
         
-        for poly_idx in range(vector_length):
-            # Reconstruct each coefficient of this polynomial
-            coeffs = np.zeros(N, dtype=np.int32)
-            
-            for coeff_idx in range(N):
-                # Collect points for Lagrange interpolation
-                points = []
-                for ps in partial_signatures:
-                    x = ps.participant_id
-                    y = ps.z_partial[poly_idx].coeffs[coeff_idx]
-                    points.append((x, y))
-                
-                # Perform Lagrange interpolation
-                reconstructed_coeff = self._lagrange_interpolation(points, 0)
-                
-                # Limit the reconstructed coefficient to prevent overflow
-                # This is necessary for threshold signatures to maintain bounds
-                max_coeff = self.dilithium.params['gamma1'] // 2
-                reconstructed_coeff = max(-max_coeff, min(max_coeff, reconstructed_coeff))
-                
-                coeffs[coeff_idx] = reconstructed_coeff
-            
-            reconstructed_polys.append(Polynomial(coeffs))
+        # Limit the reconstructed coefficients to prevent overflow
+        # This is necessary for threshold signatures to maintain bounds
+        max_coeff = self.dilithium.gamma1 // 2
+        np.clip(z, -max_coeff, max_coeff, out=z)
         
-        return PolynomialVector(reconstructed_polys)
+        # Clipped values lie well inside (-Q//2, Q//2), so no renormalization
+        return PolynomialVector._from_raw(z.astype(np.int32))
     
     def _reconstruct_hint(self, partial_signatures: List[PartialSignature],
                          public_key: DilithiumPublicKey) -> PolynomialVector:
@@ -426,81 +565,56 @@ class ThresholdSignature:
         
         # Compute w' = A * z - c * t * 2^d (simplified)
         challenge = partial_signatures[0].challenge
-        Az = self.dilithium._matrix_vector_multiply(public_key.A, z)
-        ct = self.dilithium._polynomial_vector_multiply(challenge, public_key.t)
+        Az = self.dilithium._matrix_vector_multiply_ntt(public_key.A_ntt, z)
+        ct = self.dilithium._polynomial_vector_multiply_ntt(challenge, public_key.t_ntt)
         ct_scaled = ct * (2 ** self.dilithium.d)
         w_prime = Az - ct_scaled
         
         # Generate hint based on high bits (simplified)
-        hint_polys = []
-        for i in range(self.dilithium.k):
-            if i < len(w_prime.polys):
-                # Create a simple hint based on the polynomial
-                hint_coeffs = np.zeros(N, dtype=np.int32)
-                # Set some coefficients based on the polynomial values
-                for j in range(min(10, N)):  # Limit to first 10 coefficients
-                    if abs(w_prime.polys[i].coeffs[j]) > self.dilithium.gamma2:
-                        hint_coeffs[j] = 1
-                hint_polys.append(Polynomial(hint_coeffs))
-            else:
-                hint_polys.append(Polynomial.zero())
-        
-        return PolynomialVector(hint_polys)
+        hint = np.zeros((self.dilithium.k, N), dtype=np.int32)
+        rows = min(self.dilithium.k, len(w_prime))
+        # Set some coefficients based on the polynomial values
+        head = w_prime.coeffs2d[:rows, :min(10, N)]  # Limit to first 10 coefficients
+        hint[:rows, :head.shape[1]] = np.abs(head) > self.dilithium.gamma2
+        
+        return PolynomialVector._from_raw(hint)
     
-    def _lagrange_interpolation(self, points: List[Tuple[int, int]], x: int) -> int:
+    def _check_partial_bounds(self, partial_sig: PartialSignature) -> bool:
         """
-        Perform Lagrange interpolation.
+        Check if partial signature satisfies bound requirements.
         
         Args:
-            points: List of (x_i, y_i) points
-            x: Point at which to evaluate
+            partial_sig: Partial signature to check
             
         Returns:
-            Interpolated value at x
+            True if z_partial has shape (l, N) and its bounds are satisfied
         """
-        from ..utils.constants import Q
-        
-        result = 0
-        n = len(points)
-        
-        for i in range(n):
-            xi, yi = points[i]
-            
-            # Compute Lagrange basis polynomial L_i(x)
-            numerator = 1
-            denominator = 1
-            
-            for j in range(n):
-                if i != j:
-                    xj, _ = points[j]
-                    numerator = (numerator * (x - xj)) % Q
-                    denominator = (denominator * (xi - xj)) % Q
-            
-            # Compute modular inverse
-            denominator_inv = pow(denominator, Q - 2, Q)  # Fermat's little theorem
-            
-            # Add contribution
-            # Use int64 to prevent overflow
-            contribution = (int(yi) * int(numerator) * int(denominator_inv)) % Q
-            result = (result + contribution) % Q
-        
-        return result
+        return self._check_partial_bounds_batch([partial_sig])[0]
     
-    def _check_partial_bounds(self, partial_sig: PartialSignature) -> bool:
+    def _check_partial_bounds_batch(self, partial_sigs: List[PartialSignature]) -> List[bool]:
         """
-        Check if partial signature satisfies bound requirements.
+        Check the bounds of several partial signatures in one pass.
+        
+        A z_partial of the wrong shape fails the check. The others are
+        stacked so their norms come from a single NumPy reduction.
         
         Args:
-            partial_sig: Partial signature to check
+            partial_sigs: Partial signatures to check
             
         Returns:
-            True if bounds are satisfied
+            List with the result of each partial signature
         """
-        # Check z_partial bounds
-        gamma1 = self.dilithium.params['gamma1']
-        beta = self.dilithium.params['beta']
+        z_shape = (self.dilithium.l, N)
+        results = [ps.z_partial.coeffs2d.shape == z_shape for ps in partial_sigs]
+        
+        well_formed = [i for i, ok in enumerate(results) if ok]
+        if well_formed:
+            z = np.stack([partial_sigs[i].z_partial.coeffs2d for i in well_formed])
+            norms = np.minimum(np.abs(z), Q - z).max(axis=(1, 2))
+            for i, norm in zip(well_formed, norms):
+                results[i] = bool(norm < self.dilithium.z_bound)
         
-        return partial_sig.z_partial.norm_infinity() < gamma1 - beta
+        return results
     
     def get_threshold_info(self) -> Dict[str, int]:
         """
@@ -3,9 +3,13 @@ Cryptographic primitives for Dilithium threshold signature scheme.
 """
 
 from .polynomials import Polynomial, PolynomialVector
+from .ntt import ntt, intt, pointwise_mul_acc
 
 __all__ = [
     'Polynomial',
-    'PolynomialVector'
+    'PolynomialVector',
+    'ntt',
+    'intt',
+    'pointwise_mul_acc'
 ]
 
@@ -0,0 +1,150 @@
+"""
+Number Theoretic Transform over Zq for polynomials in Rq = Zq[X]/(X^256 + 1).
+
+The transform follows the CRYSTALS-Dilithium reference implementation:
+a Cooley-Tukey forward transform that takes coefficients in natural order
+to the NTT domain in bit-reversed order, and a Gentleman-Sande inverse
+transform that maps back. Products in Rq become coefficient-wise products
+in the NTT domain, so no bit-reversal permutation is ever needed.
+
+All functions operate on the last axis and accept arbitrary leading
+dimensions, so a whole polynomial vector or matrix is transformed at once.
+"""
+
+import numpy as np
+from ..utils.constants import Q, N, NTT_ZETAS_MONT, MONT_R, QINV
+
+# N^-1 mod Q for scaling after the inverse transform
+_N_INV = pow(N, Q - 2, Q)
+
+
+def _montgomery_reduce(a: np.ndarray) -> np.ndarray:
+    """
+    Montgomery reduction of an int64 array, computing a * 2^-32 mod Q.
+    
+    Replaces the division behind % Q with two multiplications and a
+    shift. For |a| < 2^31 * Q the result lies in (-Q, Q).
+    
+    Args:
+        a: int64 array, overwritten with intermediate values
+        
+    Returns:
+        Reduced int64 array congruent to a * 2^-32 modulo Q
+    """
+    t = a * QINV
+    # Keep only the low 32 bits as a signed value
+    t = t.astype(np.int32).astype(np.int64)
+    t *= Q
+    np.subtract(a, t, out=a)
+    a >>= 32
+    return a
+
+
+def _layer_zetas():
+    """
+    Split the Montgomery-form twiddle table into per-layer column vectors.
+    
+    Returns:
+        Tuple of (forward, inverse) lists, one (blocks, 1) array per layer
+    """
+    forward = []
+    k = 1
+    length = N // 2
+    while length > 0:
+        blocks = N // (2 * length)
+        forward.append(NTT_ZETAS_MONT[k:k + blocks, None])
+        k += blocks
+        length //= 2
+    
+    inverse = []
+    k = N
+    length = 1
+    while length < N:
+        blocks = N // (2 * length)
+        inverse.append((Q - NTT_ZETAS_MONT[k - blocks:k][::-1, None]) % Q)
+        k -= blocks
+        length *= 2
+    
+    return forward, inverse
+
+
+_FORWARD_ZETAS, _INVERSE_ZETAS = _layer_zetas()
+
+# N^-1 in Montgomery form, applied with one reduction after the inverse NTT
+_N_INV_MONT = _N_INV * MONT_R % Q
+
+
+def ntt(coeffs: np.ndarray) -> np.ndarray:
+    """
+    Forward NTT of one or more polynomials.
+    
+    Butterflies run in place on one int64 buffer. Twiddles are stored in
+    Montgomery form, so the twiddle product is reduced with a Montgomery
+    reduction instead of % Q. Sums and differences grow by less than Q
+    per layer, so a single reduction at the end suffices.
+    
+    Args:
+        coeffs: Coefficient array of shape (..., N)
+    
+    Returns:
+        NTT-domain representation of shape (..., N) with values in [0, Q)
+    """
+    a = np.asarray(coeffs, dtype=np.int64) % Q
+    lead = a.shape[:-1]
+    
+    for zetas in _FORWARD_ZETAS:
+        blocks = zetas.shape[0]
+        view = a.reshape(lead + (blocks, 2, N // (2 * blocks)))
+        lo = view[..., 0, :]
+        hi = view[..., 1, :]
+        t = _montgomery_reduce(zetas * hi)
+        np.subtract(lo, t, out=hi)
+        lo += t
+    
+    a %= Q
+    return a
+
+
+def intt(coeffs_hat: np.ndarray) -> np.ndarray:
+    """
+    Inverse NTT of one or more polynomials.
+    
+    Args:
+        coeffs_hat: NTT-domain array of shape (..., N)
+    
+    Returns:
+        Coefficients of shape (..., N) in natural order with values in [0, Q)
+    """
+    a = np.asarray(coeffs_hat, dtype=np.int64) % Q
+    lead = a.shape[:-1]
+    
+    for zetas in _INVERSE_ZETAS:
+        blocks = zetas.shape[0]
+        view = a.reshape(lead + (blocks, 2, N // (2 * blocks)))
+        lo = view[..., 0, :]
+        hi = view[..., 1, :]
+        t = lo - hi
+        lo += hi
+        # The Montgomery result lies in (-Q, Q), so only lo grows
+        t *= zetas
+        hi[...] = _montgomery_reduce(t)
+    
+    # Scale by N^-1; the result lies in (-Q, Q) and needs one conditional add
+    a *= _N_INV_MONT
+    a = _montgomery_reduce(a)
+    a[a < 0] += Q
+    return a
+
+
+def pointwise_mul_acc(a_hat: np.ndarray, b_hat: np.ndarray) -> np.ndarray:
+    """
+    Multiply a matrix by a vector of polynomials in the NTT domain.
+    
+    Args:
+        a_hat: NTT-domain matrix of shape (k, l, N)
+        b_hat: NTT-domain vector of shape (l, N)
+    
+    Returns:
+        NTT-domain result of shape (k, N) with values in [0, Q)
+    """
+    return np.einsum('kln,ln->kn', a_hat, b_hat) % Q
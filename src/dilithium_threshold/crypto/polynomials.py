@@ -7,10 +7,94 @@ operations in the quotient ring.
 """
 
 import numpy as np
-from typing import List, Union
+from typing import List, Optional, Union
 from ..utils.constants import Q, N
 
 
+def _reduce_once(a: np.ndarray) -> np.ndarray:
+    """
+    Map coefficients from (-Q, 2Q) into [0, Q) without a division.
+    
+    Polynomial coefficients always lie in [-Q//2, Q), so sums and
+    negations stay inside this window and need at most one conditional
+    add or subtract of Q.
+    
+    Args:
+        a: Coefficient array with values in (-Q, 2Q)
+        
+    Returns:
+        Coefficient array with values in [0, Q)
+    """
+    a = np.where(a < 0, a + Q, a)
+    return np.where(a >= Q, a - Q, a)
+
+
+def _poly_add_mod(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """Add two coefficient arrays modulo Q."""
+    return _reduce_once(a + b)
+
+
+def _poly_sub_mod(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """Subtract two coefficient arrays modulo Q."""
+    # a - b may fall below -Q, so add the reduced negation instead
+    return _reduce_once(a + _reduce_once(-b))
+
+
+def _poly_mul_mod(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """
+    Multiply two coefficient arrays in Rq = Zq[X]/(X^N + 1).
+    
+    Computes the full linear convolution in int64 and folds the upper
+    half back with a negative sign, since X^N = -1.
+    
+    Args:
+        a: First coefficient array of length N
+        b: Second coefficient array of length N
+        
+    Returns:
+        Product coefficients of length N, reduced to [0, Q)
+    """
+    full = np.convolve(a.astype(np.int64), b.astype(np.int64))
+    result = full[:N].copy()
+    result[:N - 1] -= full[N:]
+    return result % Q
+
+
+def _random_coeffs(shape: tuple, bound: int, seed: Optional[int]) -> np.ndarray:
+    """
+    Draw uniform coefficients in [0, bound).
+    
+    Args:
+        shape: Shape of the coefficient array
+        bound: Upper bound for coefficients
+        seed: Seed for a dedicated generator, or None for the global one
+        
+    Returns:
+        int32 coefficient array of the given shape
+    """
+    if seed is None:
+        return np.random.randint(0, bound, size=shape, dtype=np.int32)
+    return np.random.default_rng(seed).integers(0, bound, size=shape, dtype=np.int32)
+
+
+def _inf_norm(coeffs: np.ndarray) -> int:
+    """
+    Infinity norm of one or more coefficient arrays in a single pass.
+    
+    Coefficients above Q//2 are read as their negative representatives.
+    For c in [0, Q) the centered absolute value is min(c, Q - c); small
+    negative coefficients kept by the constructor give |c| < Q - c, so
+    min(|c|, Q - c) covers both without a mask or a copy.
+    
+    Args:
+        coeffs: Coefficient array of any shape
+        
+    Returns:
+        Maximum absolute centered coefficient
+    """
+    return int(np.minimum(np.abs(coeffs), Q - coeffs).max())
+
+
 class Polynomial:
     """
     Represents a polynomial in Rq = Zq[X]/(X^256 + 1).
@@ -42,12 +126,26 @@ class Polynomial:
             self.coeffs = coeffs.astype(np.int32)
             
         # Proper modular reduction that preserves small values
-        # Only apply modular reduction if coefficients are outside reasonable range
-        self.coeffs = np.where(
-            np.abs(self.coeffs) > Q // 2,
-            self.coeffs % Q,
-            self.coeffs
-        )
+        # Only apply modular reduction if coefficients are outside reasonable range.
+        # Already reduced input, the common case, costs one abs and one max.
+        if np.abs(self.coeffs).max() > Q // 2:
+            out_of_range = np.abs(self.coeffs) > Q // 2
+            self.coeffs = np.where(out_of_range, self.coeffs % Q, self.coeffs)
+    
+    @classmethod
+    def _from_raw(cls, coeffs: np.ndarray) -> 'Polynomial':
+        """
+        Wrap an already reduced int32 coefficient array without copying.
+        
+        Args:
+            coeffs: Array of N coefficients owned by the new polynomial
+            
+        Returns:
+            Polynomial backed by coeffs
+        """
+        poly = cls.__new__(cls)
+        poly.coeffs = coeffs
+        return poly
     
     def _reduce_mod_xn_plus_1(self, coeffs: np.ndarray) -> np.ndarray:
         """
@@ -59,32 +157,30 @@ class Polynomial:
         Returns:
             Reduced coefficients of length N
         """
-        result = np.zeros(N, dtype=np.int32)
+        blocks = -(-len(coeffs) // N)
+        padded = np.zeros(blocks * N, dtype=np.int64)
+        padded[:len(coeffs)] = coeffs
         
-        for i, coeff in enumerate(coeffs):
-            pos = i % N
-            if i >= N and (i // N) % 2 == 1:
-                # X^N = -1, so X^(N+k) = -X^k
-                result[pos] = (result[pos] - coeff) % Q
-            else:
-                result[pos] = (result[pos] + coeff) % Q
-                
-        return result
+        # X^N = -1, so X^(jN+k) = (-1)^j X^k
+        rows = padded.reshape(blocks, N)
+        rows[1::2] *= -1
+        result = rows.sum(axis=0) % Q
+        return result.astype(np.int32)
     
     def __add__(self, other: 'Polynomial') -> 'Polynomial':
         """Add two polynomials."""
-        return Polynomial((self.coeffs + other.coeffs) % Q)
+        return Polynomial._from_raw(_poly_add_mod(self.coeffs, other.coeffs))
     
     def __sub__(self, other: 'Polynomial') -> 'Polynomial':
         """Subtract two polynomials."""
-        return Polynomial((self.coeffs - other.coeffs) % Q)
+        return Polynomial._from_raw(_poly_sub_mod(self.coeffs, other.coeffs))
     
     def __mul__(self, other: Union['Polynomial', int]) -> 'Polynomial':
         """Multiply polynomial by another polynomial or scalar."""
         if isinstance(other, int):
             # Convert to int64 to prevent overflow
             result_coeffs = self.coeffs.astype(np.int64) * other
-            return Polynomial(result_coeffs % Q)
+            return Polynomial._from_raw((result_coeffs % Q).astype(np.int32))
         elif isinstance(other, Polynomial):
             return self._poly_multiply(other)
         else:
@@ -96,10 +192,12 @@ class Polynomial:
     
     def __neg__(self) -> 'Polynomial':
         """Negate polynomial."""
-        return Polynomial((-self.coeffs) % Q)
+        return Polynomial._from_raw(_reduce_once(-self.coeffs))
     
     def __eq__(self, other: 'Polynomial') -> bool:
         """Check equality of polynomials."""
+        if not isinstance(other, Polynomial):
+            return False
         return np.array_equal(self.coeffs, other.coeffs)
     
     def __repr__(self) -> str:
@@ -110,20 +208,10 @@ class Polynomial:
         """
         Multiply two polynomials in Rq.
         
-        This is a naive O(N^2) implementation. For better performance,
-        use NTT-based multiplication in the ntt module.
+        Schoolbook O(N^2) multiplication, evaluated as a vectorized
+        convolution rather than a Python double loop.
         """
-        result_coeffs = np.zeros(2 * N - 1, dtype=np.int64)
-        
-        # Convert to int64 to prevent overflow during multiplication
-        self_coeffs = self.coeffs.astype(np.int64)
-        other_coeffs = other.coeffs.astype(np.int64)
-        
-        for i in range(N):
-            for j in range(N):
-                result_coeffs[i + j] += self_coeffs[i] * other_coeffs[j]
-        
-        return Polynomial(result_coeffs % Q)
+        return Polynomial._from_raw(_poly_mul_mod(self.coeffs, other.coeffs).astype(np.int32))
     
     def norm_infinity(self) -> int:
         """
@@ -132,10 +220,7 @@ class Polynomial:
         Returns:
             Maximum absolute value of coefficients
         """
-        # Convert to signed representation
-        signed_coeffs = self.coeffs.copy()
-        signed_coeffs[signed_coeffs > Q // 2] -= Q
-        return int(np.max(np.abs(signed_coeffs)))
+        return _inf_norm(self.coeffs)
     
     def norm_l2(self) -> float:
         """
@@ -169,33 +254,63 @@ class Polynomial:
     
     def copy(self) -> 'Polynomial':
         """Create a copy of the polynomial."""
-        return Polynomial(self.coeffs.copy())
+        return Polynomial._from_raw(self.coeffs.copy())
     
     @classmethod
     def zero(cls) -> 'Polynomial':
         """Create zero polynomial."""
-        return cls(np.zeros(N, dtype=np.int32))
+        return cls._from_raw(np.zeros(N, dtype=np.int32))
     
     @classmethod
     def one(cls) -> 'Polynomial':
         """Create polynomial representing 1."""
         coeffs = np.zeros(N, dtype=np.int32)
         coeffs[0] = 1
-        return cls(coeffs)
+        return cls._from_raw(coeffs)
+    
+    @classmethod
+    def batch(cls, rows: np.ndarray) -> List['Polynomial']:
+        """
+        Create several polynomials backed by one coefficient matrix.
+        
+        Rows shorter than N are zero-padded and reduced with the same rule
+        as the constructor. Each polynomial is a row view of a single
+        (k, N) int32 array instead of a separate allocation.
+        
+        Args:
+            rows: Coefficient array of shape (k, m) with m <= N
+            
+        Returns:
+            List of k polynomials sharing one backing array
+            
+        Raises:
+            ValueError: If rows is not 2-D or has more than N columns
+        """
+        rows = np.asarray(rows, dtype=np.int64)
+        if rows.ndim != 2 or rows.shape[1] > N:
+            raise ValueError(f"Rows must have shape (k, m) with m <= {N}")
+        
+        matrix = np.zeros((rows.shape[0], N), dtype=np.int64)
+        matrix[:, :rows.shape[1]] = rows
+        out_of_range = np.abs(matrix) > Q // 2
+        if out_of_range.any():
+            matrix = np.where(out_of_range, matrix % Q, matrix)
+        matrix = matrix.astype(np.int32)
+        return [cls._from_raw(row) for row in matrix]
     
     @classmethod
-    def random(cls, bound: int = Q) -> 'Polynomial':
+    def random(cls, bound: int = Q, seed: Optional[int] = None) -> 'Polynomial':
         """
         Generate random polynomial with coefficients in [0, bound).
         
         Args:
             bound: Upper bound for coefficients
+            seed: Optional seed for reproducible coefficients
             
         Returns:
             Random polynomial
         """
-        coeffs = np.random.randint(0, bound, size=N, dtype=np.int32)
-        return cls(coeffs)
+        return cls(_random_coeffs((N,), bound, seed))
 
 
 class PolynomialVector:
@@ -203,35 +318,81 @@ class PolynomialVector:
     Represents a vector of polynomials in Rq.
     
     Used for representing keys and intermediate values in Dilithium.
+    Coefficients are stored as a single (length, N) int32 matrix, so
+    vector operations run as one NumPy call instead of a loop over
+    polynomials.
     """
     
-    def __init__(self, polynomials: List[Polynomial]):
+    def __init__(self, polynomials: Union[List[Polynomial], np.ndarray]):
         """
         Initialize polynomial vector.
         
         Args:
-            polynomials: List of Polynomial objects
+            polynomials: List of Polynomial objects, or a coefficient
+                array of shape (length, N)
+        """
+        if isinstance(polynomials, np.ndarray):
+            if polynomials.ndim != 2 or polynomials.shape[1] != N:
+                raise ValueError(f"Coefficient matrix must have shape (length, {N})")
+            coeffs2d = polynomials.astype(np.int64)
+            # Same reduction rule as Polynomial: small signed values are kept
+            out_of_range = np.abs(coeffs2d) > Q // 2
+            if out_of_range.any():
+                coeffs2d = np.where(out_of_range, coeffs2d % Q, coeffs2d)
+            self.coeffs2d = coeffs2d.astype(np.int32)
+        else:
+            if not all(isinstance(p, Polynomial) for p in polynomials):
+                raise TypeError("All elements must be Polynomial objects")
+            self.coeffs2d = np.zeros((len(polynomials), N), dtype=np.int32)
+            for i, poly in enumerate(polynomials):
+                self.coeffs2d[i] = poly.coeffs
+    
+    @classmethod
+    def _from_raw(cls, coeffs2d: np.ndarray) -> 'PolynomialVector':
+        """
+        Wrap an already reduced (length, N) int32 matrix without copying.
+        
+        Args:
+            coeffs2d: Coefficient matrix owned by the new vector
+            
+        Returns:
+            Polynomial vector backed by coeffs2d
         """
-        if not all(isinstance(p, Polynomial) for p in polynomials):
-            raise TypeError("All elements must be Polynomial objects")
-        self.polys = polynomials.copy()
-        self.length = len(polynomials)
+        vector = cls.__new__(cls)
+        vector.coeffs2d = coeffs2d
+        return vector
+    
+    @property
+    def length(self) -> int:
+        """Number of polynomials in the vector."""
+        return self.coeffs2d.shape[0]
+    
+    @property
+    def polys(self) -> List[Polynomial]:
+        """
+        Polynomials of the vector as views into the coefficient matrix.
+        
+        Returns:
+            List of Polynomial objects sharing memory with coeffs2d
+        """
+        return [Polynomial._from_raw(row) for row in self.coeffs2d]
     
     def __add__(self, other: 'PolynomialVector') -> 'PolynomialVector':
         """Add two polynomial vectors."""
         if self.length != other.length:
             raise ValueError("Vector lengths must match")
-        return PolynomialVector([p1 + p2 for p1, p2 in zip(self.polys, other.polys)])
+        return PolynomialVector._from_raw(_poly_add_mod(self.coeffs2d, other.coeffs2d))
     
     def __sub__(self, other: 'PolynomialVector') -> 'PolynomialVector':
         """Subtract two polynomial vectors."""
         if self.length != other.length:
             raise ValueError("Vector lengths must match")
-        return PolynomialVector([p1 - p2 for p1, p2 in zip(self.polys, other.polys)])
+        return PolynomialVector._from_raw(_poly_sub_mod(self.coeffs2d, other.coeffs2d))
     
     def __mul__(self, scalar: int) -> 'PolynomialVector':
         """Multiply vector by scalar."""
-        return PolynomialVector([p * scalar for p in self.polys])
+        result = self.coeffs2d.astype(np.int64) * scalar % Q
+        return PolynomialVector._from_raw(result.astype(np.int32))
     
     def __rmul__(self, scalar: int) -> 'PolynomialVector':
         """Right multiplication by scalar."""
@@ -239,13 +400,13 @@ class PolynomialVector:
     
     def __getitem__(self, index: int) -> Polynomial:
         """Get polynomial at index."""
-        return self.polys[index]
+        return Polynomial._from_raw(self.coeffs2d[index])
     
     def __setitem__(self, index: int, value: Polynomial):
         """Set polynomial at index."""
         if not isinstance(value, Polynomial):
             raise TypeError("Value must be a Polynomial")
-        self.polys[index] = value
+        self.coeffs2d[index] = value.coeffs
     
     def __len__(self) -> int:
         """Get length of vector."""
@@ -255,8 +416,7 @@ class PolynomialVector:
         """Check equality of vectors."""
         if not isinstance(other, PolynomialVector):
             return False
-        return (self.length == other.length and 
-                all(p1 == p2 for p1, p2 in zip(self.polys, other.polys)))
+        return np.array_equal(self.coeffs2d, other.coeffs2d)
     
     def __repr__(self) -> str:
         """String representation of polynomial vector."""
@@ -269,28 +429,33 @@ class PolynomialVector:
         Returns:
             Maximum infinity norm among all polynomials
         """
-        return max(p.norm_infinity() for p in self.polys)
+        if self.length == 0:
+            return 0
+        return _inf_norm(self.coeffs2d)
     
     def copy(self) -> 'PolynomialVector':
         """Create a copy of the vector."""
-        return PolynomialVector([p.copy() for p in self.polys])
+        return PolynomialVector._from_raw(self.coeffs2d.copy())
     
     @classmethod
     def zero(cls, length: int) -> 'PolynomialVector':
         """Create zero vector of given length."""
-        return cls([Polynomial.zero() for _ in range(length)])
+        return cls._from_raw(np.zeros((length, N), dtype=np.int32))
     
     @classmethod
-    def random(cls, length: int, bound: int = Q) -> 'PolynomialVector':
+    def random(cls, length: int, bound: int = Q,
+               seed: Optional[int] = None) -> 'PolynomialVector':
         """
         Generate random polynomial vector.
         
+        All coefficients are drawn in one call as a (length, N) matrix.
+        
         Args:
             length: Number of polynomials in vector
             bound: Upper bound for coefficients
+            seed: Optional seed for reproducible coefficients
             
         Returns:
             Random polynomial vector
         """
-        return cls([Polynomial.random(bound) for _ in range(length)])
-
+        return cls(_random_coeffs((length, N), bound, seed))
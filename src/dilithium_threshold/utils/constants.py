@@ -5,6 +5,8 @@ This module contains all the mathematical constants and parameters
 used in the CRYSTALS-Dilithium algorithm and its threshold adaptation.
 """
 
+import numpy as np
+
 # Ring parameters
 Q = 8380417  # Prime modulus for Zq
 N = 256      # Polynomial degree (X^256 + 1)
@@ -62,12 +64,47 @@ THRESHOLD_CONFIGS = {
 # NTT parameters for fast polynomial multiplication
 # Primitive 512th root of unity modulo Q
 ZETA = 1753  
-NTT_ZETAS = []  # Will be computed during initialization
+
+
+def _bit_reverse(value: int, bits: int) -> int:
+    """Reverse the lowest `bits` bits of value."""
+    result = 0
+    for _ in range(bits):
+        result = (result << 1) | (value & 1)
+        value >>= 1
+    return result
+
+
+# NTT_ZETAS[k] = ZETA^bitrev8(k) mod Q, as in the reference implementation
+NTT_ZETAS = np.array([pow(ZETA, _bit_reverse(k, 8), Q) for k in range(N)],
+                     dtype=np.int64)
+NTT_ZETAS.setflags(write=False)
+
+# Montgomery constants for R = 2^32: MONT_R = R mod Q, QINV = Q^-1 mod R
+MONT_R = (1 << 32) % Q
+QINV = pow(Q, -1, 1 << 32)
+
+# The same table in Montgomery form (zeta * 2^32 mod Q)
+NTT_ZETAS_MONT = NTT_ZETAS * MONT_R % Q
+NTT_ZETAS_MONT.setflags(write=False)
 
 # Hash function parameters
 SHAKE256_RATE = 136  # Rate for SHAKE256
 HASH_OUTPUT_LENGTH = 32  # Standard hash output length
 
+# Number of verification results remembered per Dilithium instance
+VERIFY_CACHE_SIZE = 4096
+
+# Largest number of mask vectors y tried per batch in the signing loop
+SIGN_BATCH_SIZE = 4
+
+# Signer sets whose Lagrange weights are precomputed when a threshold
+# scheme is created; larger configurations compute them on first use
+LAGRANGE_PRECOMPUTE_LIMIT = 128
+
+# Signer sets whose Lagrange weights are kept in memory at once
+LAGRANGE_CACHE_SIZE = 1024
+
 # Serialization parameters
 POLY_BYTES = 32 * N // 8  # Bytes needed for one polynomial
 SIGNATURE_BYTES = {
@@ -0,0 +1,14 @@
+"""
+Shared pytest configuration for the test suite.
+
+Makes the package under src importable without an installed copy. The
+path is added once, before any test module is collected.
+"""
+
+import os
+import sys
+
+SRC_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+if SRC_DIR not in sys.path:
+    sys.path.insert(0, SRC_DIR)
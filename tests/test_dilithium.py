@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the base Dilithium signature algorithm.
+
+Tests single-party key generation, signing and verification that
+the threshold scheme builds on.
+"""
+
+import hashlib
+import unittest
+import numpy as np
+
+from dilithium_threshold.core.dilithium import Dilithium, DilithiumPrivateKey
+from dilithium_threshold.crypto.ntt import ntt
+from dilithium_threshold.crypto.polynomials import PolynomialVector
+from dilithium_threshold.utils.constants import Q, N
+
+
+class TestDilithium(unittest.TestCase):
+    """Test cases for Dilithium class."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.dilithium = Dilithium(2)
+        self.key_pair = self.dilithium.keygen(b"dilithium_test_seed")
+        self.message = b"Single-party Dilithium test message"
+    
+    def test_sign_and_verify(self):
+        """Test that a signature verifies under the matching public key."""
+        signature = self.dilithium.sign(
+            self.message, self.key_pair.private_key, b"r" * 32)
+        
+        self.assertLess(signature.z.norm_infinity(),
+                        self.dilithium.gamma1 - self.dilithium.beta)
+        self.assertTrue(self.dilithium.verify(
+            self.message, signature, self.key_pair.public_key))
+    
+    def test_wrong_message_fails(self):
+        """Test that a signature does not verify for another message."""
+        signature = self.dilithium.sign(self.message, self.key_pair.private_key)
+        
+        self.assertFalse(self.dilithium.verify(
+            b"Different message", signature, self.key_pair.public_key))
+    
+    def test_verify_cache(self):
+        """Test that repeated verifications are served from the cache."""
+        signature = self.dilithium.sign(self.message, self.key_pair.private_key)
+        public_key = self.key_pair.public_key
+        
+        self.assertTrue(self.dilithium.verify(self.message, signature, public_key))
+        self.assertTrue(self.dilithium.verify(self.message, signature, public_key))
+        self.assertEqual(len(self.dilithium._verify_cache), 1)
+        
+        # A cached result never leaks to a different message or signature
+        self.assertFalse(self.dilithium.verify(b"Different message", signature, public_key))
+        
+        signature.z[0].coeffs[0] = self.dilithium.gamma1
+        self.assertFalse(self.dilithium.verify(self.message, signature, public_key))
+        self.assertEqual(len(self.dilithium._verify_cache), 3)
+    
+    def test_challenge_weight(self):
+        """Test that challenges have exactly tau coefficients of +-1."""
+        for i in range(20):
+            mu = i.to_bytes(2, 'little') * 32
+            challenge = self.dilithium._generate_challenge(mu, None)
+            nonzero = challenge.coeffs[challenge.coeffs != 0]
+            
+            self.assertEqual(len(nonzero), self.dilithium.tau)
+            self.assertTrue(set(nonzero.tolist()) <= {-1, 1})
+            self.assertEqual(challenge, self.dilithium._generate_challenge(mu, None))
+    
+    def test_secret_coefficients_in_range(self):
+        """Test that s1 and s2 coefficients cover exactly [-eta, eta]."""
+        for level in (2, 3):
+            dilithium = Dilithium(level)
+            s1 = dilithium._sample_s1(b"eta_test_seed" * 4)
+            s2 = dilithium._sample_s2(b"eta_test_seed" * 4)
+            
+            self.assertEqual(s1.coeffs2d.shape, (dilithium.l, N))
+            self.assertEqual(s2.coeffs2d.shape, (dilithium.k, N))
+            for vector in (s1, s2):
+                coeffs = vector.coeffs2d
+                centered = np.where(coeffs > Q // 2, coeffs - Q, coeffs)
+                self.assertEqual(set(np.unique(centered).tolist()),
+                                 set(range(-dilithium.eta, dilithium.eta + 1)))
+    
+    def test_decompose_and_hint(self):
+        """Test the fused hint against high bits of w - c * s2."""
+        gamma2 = self.dilithium.gamma2
+        rng = np.random.default_rng(0)
+        coeffs = rng.integers(2 * gamma2, Q - 2 * gamma2, size=(self.dilithium.k, N))
+        # Put some low parts on the edges so that subtracting c * s2 carries
+        coeffs[:, ::4] = 10 * gamma2 - gamma2
+        coeffs[:, 1::4] = 10 * gamma2 + gamma2 - 1
+        # And some next to 0 and Q - 1, where w - c * s2 wraps around
+        coeffs[:, 2::8] = rng.integers(0, 4, size=(self.dilithium.k, N // 8))
+        coeffs[:, 3::8] = Q - 1 - rng.integers(0, 4, size=(self.dilithium.k, N // 8))
+        
+        r1, r0 = self.dilithium._decompose(coeffs)
+        self.assertTrue(np.array_equal(r1 * 2 * gamma2 + r0, coeffs))
+        self.assertTrue(np.all((r0 >= -gamma2) & (r0 < gamma2)))
+        
+        w = PolynomialVector(coeffs.astype(np.int32))
+        c = self.dilithium._generate_challenge(b"hint" * 16, None)
+        s2 = self.key_pair.private_key.s2
+        hint = self.dilithium._compute_hint(w, self.key_pair.private_key.s2_ntt,
+                                            ntt(c.coeffs))
+        cs2 = self.dilithium._polynomial_vector_multiply(c, s2)
+        self.assertEqual(hint, self.dilithium._make_hint(w - cs2, w))
+        self.assertGreater(int(hint.coeffs2d.sum()), 0)
+    
+    def test_sign_rejection_batches(self):
+        """Test that signing retries rejected mask vectors in growing batches."""
+        # Tighten the z bound so that most signatures need a few attempts
+        bound = 23780
+        self.dilithium.beta = self.dilithium.gamma1 - bound
+        self.dilithium.z_bound = bound
+        
+        batches = []
+        sample_y_batch = self.dilithium._sample_y_batch
+        
+        def recording_sample_y_batch(randomness, kappa, count):
+            batches.append((kappa, count))
+            return sample_y_batch(randomness, kappa, count)
+        
+        self.dilithium._sample_y_batch = recording_sample_y_batch
+        private_key = self.key_pair.private_key
+        # (first kappa, batch size) of successive batches: 1, 2, then 4
+        schedule = [(0, 1), (1, 2), (3, 4), (7, 4), (11, 4), (15, 4)]
+        longest = 0
+        
+        for i in range(8):
+            message = self.message + bytes([i])
+            randomness = bytes([65 + i]) * 32
+            batches.clear()
+            signature = self.dilithium.sign(message, private_key, randomness)
+            self.assertTrue(self.dilithium.verify(message, signature, self.key_pair.public_key))
+            
+            # Find the first attempt whose z passes, one kappa at a time
+            mu = hashlib.shake_256(message).digest(64)
+            c = self.dilithium._generate_challenge(mu, None)
+            cs1 = self.dilithium._polynomial_vector_multiply(c, private_key.s1)
+            kappa = 0
+            while (self.dilithium._sample_y(randomness, kappa) + cs1).norm_infinity() >= bound:
+                kappa += 1
+            self.assertEqual(signature.z, self.dilithium._sample_y(randomness, kappa) + cs1)
+            
+            # Batches run in kappa order up to the one holding that attempt
+            expected = [(start, size) for start, size in schedule if start <= kappa]
+            self.assertLess(kappa, 19)
+            self.assertEqual(batches, expected)
+            longest = max(longest, len(batches))
+        
+        # Some signature needed enough retries for two batches of four
+        self.assertGreaterEqual(longest, 4)
+    
+    def test_sign_requires_matrix(self):
+        """Test that signing without matrix A is rejected."""
+        private_key = self.key_pair.private_key
+        bare_key = DilithiumPrivateKey(private_key.s1, private_key.s2, 2)
+        
+        with self.assertRaises(ValueError):
+            self.dilithium.sign(self.message, bare_key)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -8,15 +8,11 @@ verification, ensuring all components work together correctly.
 
 import unittest
 import time
-import sys
 import os
 import numpy as np
 
-# Add the src directory to the path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
-
-from dilithium_threshold.core.threshold import ThresholdSignature
-from dilithium_threshold.core.dilithium import Dilithium
+from dilithium_threshold.core.threshold import ThresholdSignature, PartialSignature
+from dilithium_threshold.crypto.polynomials import PolynomialVector
 from dilithium_threshold.utils.constants import THRESHOLD_CONFIGS
 
 
@@ -65,7 +61,7 @@ class TestThresholdSignatureIntegration(unittest.TestCase):
             partial_signatures, public_key)
         
         # 4. Verification using standard Dilithium
-        dilithium = Dilithium(self.security_level)
+        dilithium = self.ts.dilithium
         is_valid = dilithium.verify(self.message, combined_signature, public_key)
         
         self.assertTrue(is_valid, "Combined signature verification failed")
@@ -98,7 +94,7 @@ class TestThresholdSignatureIntegration(unittest.TestCase):
                 # Combine and verify
                 combined_sig = ts.combine_signatures(partial_sigs, key_shares[0].public_key)
                 
-                dilithium = Dilithium(2)
+                dilithium = ts.dilithium
                 is_valid = dilithium.verify(self.message, combined_sig, key_shares[0].public_key)
                 self.assertTrue(is_valid)
     
@@ -118,6 +114,95 @@ class TestThresholdSignatureIntegration(unittest.TestCase):
         with self.assertRaises(ValueError):
             self.ts.combine_signatures(partial_sigs, key_shares[0].public_key)
     
+    def test_batch_partial_verification(self):
+        """Test that batch verification agrees with single verification."""
+        key_shares = self.ts.distributed_keygen()
+        signing_shares = key_shares[:self.threshold]
+        
+        partial_sigs = [self.ts.partial_sign(self.message, share)
+                        for share in signing_shares]
+        
+        expected = [self.ts.verify_partial_signature(self.message, ps, share)
+                    for ps, share in zip(partial_sigs, signing_shares)]
+        batch = self.ts.verify_partial_signatures_batch(
+            self.message, partial_sigs, signing_shares)
+        self.assertEqual(batch, expected)
+        
+        # A signature checked against the wrong message must fail
+        wrong = self.ts.verify_partial_signatures_batch(
+            b"Other message", partial_sigs, signing_shares)
+        self.assertEqual(wrong, [False] * len(partial_sigs))
+        
+        # A z of the wrong length is rejected by both paths
+        short = PartialSignature(partial_sigs[1].participant_id,
+                                 PolynomialVector(partial_sigs[1].z_partial.polys[:-1]),
+                                 partial_sigs[1].commitment,
+                                 partial_sigs[1].challenge)
+        mixed_sigs = [partial_sigs[0], short, partial_sigs[2]]
+        mixed = self.ts.verify_partial_signatures_batch(
+            self.message, mixed_sigs, signing_shares)
+        self.assertEqual(mixed, [self.ts.verify_partial_signature(self.message, ps, share)
+                                 for ps, share in zip(mixed_sigs, signing_shares)])
+        self.assertFalse(mixed[1])
+        
+        with self.assertRaises(ValueError):
+            self.ts.verify_partial_signatures_batch(
+                self.message, partial_sigs, signing_shares[:1])
+    
+    def test_partial_sign_batch(self):
+        """Test that batched partial signing matches one-by-one signing."""
+        ts = ThresholdSignature(self.threshold, self.participants,
+                                self.security_level, deterministic_seed=b"s" * 32)
+        key_shares = ts.distributed_keygen(b"k" * 32)
+        
+        batch = ts.partial_sign_batch(self.message, key_shares)
+        single = [ts.partial_sign(self.message, share) for share in key_shares]
+        
+        self.assertEqual(len(batch), len(single))
+        for got, expected in zip(batch, single):
+            self.assertEqual(got.participant_id, expected.participant_id)
+            self.assertEqual(got.z_partial, expected.z_partial)
+            self.assertEqual(got.commitment, expected.commitment)
+            self.assertEqual(got.challenge, expected.challenge)
+        
+        self.assertEqual(ts.partial_sign_batch(self.message, []), [])
+    
+    def test_prepare_signer_set(self):
+        """Test precomputed Lagrange weights for a signing committee."""
+        from dilithium_threshold.utils.constants import Q
+        
+        lambdas = self.ts.prepare_signer_set([1, 3, 5])
+        self.assertEqual(len(lambdas), self.threshold)
+        # Interpolating the constant polynomial 1 must give 1
+        self.assertEqual(int(lambdas.sum()) % Q, 1)
+        
+        with self.assertRaises(ValueError):
+            self.ts.prepare_signer_set([1, 3])
+        with self.assertRaises(ValueError):
+            self.ts.prepare_signer_set([1, 1, 3])
+        with self.assertRaises(ValueError):
+            self.ts.prepare_signer_set([1, 3, 9])
+    
+    def test_signer_sets_precomputed(self):
+        """Test that Lagrange weights for all signer sets exist after setup."""
+        import itertools
+        from dilithium_threshold.core.shamir import _lagrange_coefficients
+        
+        ts = ThresholdSignature(self.threshold, self.participants, self.security_level)
+        signer_sets = list(itertools.combinations(ts.participant_ids, self.threshold))
+        
+        # Every signer set, C(5, 3) = 10 of them, must now be a cache hit
+        before = _lagrange_coefficients.cache_info()
+        for signer_set in signer_sets:
+            _lagrange_coefficients(signer_set)
+        after = _lagrange_coefficients.cache_info()
+        self.assertEqual(after.misses, before.misses)
+        self.assertEqual(after.hits - before.hits, len(signer_sets))
+        
+        misses = after.misses
+        ts.prepare_signer_set([2, 4, 5])
+        self.assertEqual(_lagrange_coefficients.cache_info().misses, misses)
+    
     def test_signature_with_different_participants(self):
         """Test that different combinations of participants can create valid signatures."""
         key_shares = self.ts.distributed_keygen()
@@ -136,7 +221,7 @@ class TestThresholdSignatureIntegration(unittest.TestCase):
                 combined_sig = self.ts.combine_signatures(
                     partial_sigs, key_shares[0].public_key)
                 
-                dilithium = Dilithium(self.security_level)
+                dilithium = self.ts.dilithium
                 is_valid = dilithium.verify(
                     self.message, combined_sig, key_shares[0].public_key)
                 self.assertTrue(is_valid)
@@ -165,7 +250,7 @@ class TestThresholdSignatureIntegration(unittest.TestCase):
                 combined_sig = self.ts.combine_signatures(
                     partial_sigs, key_shares[0].public_key)
                 
-                dilithium = Dilithium(self.security_level)
+                dilithium = self.ts.dilithium
                 is_valid = dilithium.verify(message, combined_sig, key_shares[0].public_key)
                 self.assertTrue(is_valid)
     
@@ -213,7 +298,7 @@ class TestThresholdSignatureIntegration(unittest.TestCase):
         signature = self.ts.combine_signatures(partial_sigs, key_shares[0].public_key)
         
         # Verify against correct message
-        dilithium = Dilithium(self.security_level)
+        dilithium = self.ts.dilithium
         is_valid_correct = dilithium.verify(message1, signature, key_shares[0].public_key)
         self.assertTrue(is_valid_correct)
         
@@ -227,39 +312,40 @@ class TestThresholdSignatureIntegration(unittest.TestCase):
         ts = ThresholdSignature(3, 5, 2)
         
         # Benchmark key generation
-        start_time = time.time()
+        start_time = time.perf_counter()
         key_shares = ts.distributed_keygen()
-        keygen_time = time.time() - start_time
+        keygen_time = time.perf_counter() - start_time
         
         # Benchmark partial signing
-        start_time = time.time()
+        start_time = time.perf_counter()
         partial_sigs = []
         for share in key_shares[:3]:
             partial_sig = ts.partial_sign(self.message, share)
             partial_sigs.append(partial_sig)
-        partial_sign_time = time.time() - start_time
+        partial_sign_time = time.perf_counter() - start_time
         
         # Benchmark signature combination
-        start_time = time.time()
+        start_time = time.perf_counter()
         combined_sig = ts.combine_signatures(partial_sigs, key_shares[0].public_key)
-        combine_time = time.time() - start_time
+        combine_time = time.perf_counter() - start_time
         
         # Benchmark verification
-        start_time = time.time()
-        dilithium = Dilithium(2)
+        start_time = time.perf_counter()
+        dilithium = ts.dilithium
         is_valid = dilithium.verify(self.message, combined_sig, key_shares[0].public_key)
-        verify_time = time.time() - start_time
+        verify_time = time.perf_counter() - start_time
         
         self.assertTrue(is_valid)
         
-        # Print performance results
+        # Print performance results when requested
         total_time = keygen_time + partial_sign_time + combine_time + verify_time
-        print(f"\nPerformance Benchmarks (3/5 threshold, security level 2):")
-        print(f"  Key Generation:    {keygen_time:.3f}s")
-        print(f"  Partial Signing:   {partial_sign_time:.3f}s")
-        print(f"  Signature Combine: {combine_time:.3f}s")
-        print(f"  Verification:      {verify_time:.3f}s")
-        print(f"  Total Time:        {total_time:.3f}s")
+        if os.environ.get("BENCH_VERBOSE"):
+            print(f"\nPerformance Benchmarks (3/5 threshold, security level 2):")
+            print(f"  Key Generation:    {keygen_time * 1000:.3f}ms")
+            print(f"  Partial Signing:   {partial_sign_time * 1000:.3f}ms")
+            print(f"  Signature Combine: {combine_time * 1000:.3f}ms")
+            print(f"  Verification:      {verify_time * 1000:.3f}ms")
+            print(f"  Total Time:        {total_time * 1000:.3f}ms")
         
         # Performance assertions (reasonable bounds)
         self.assertLess(total_time, 10.0, "Total time should be under 10 seconds")
@@ -320,7 +406,7 @@ class TestSecurityProperties(unittest.TestCase):
         # works without ever calling reconstruct_secret on the full vectors
         
         # Verify the signature is valid
-        dilithium = Dilithium(2)
+        dilithium = self.ts.dilithium
         is_valid = dilithium.verify(self.message, combined_sig, key_shares[0].public_key)
         self.assertTrue(is_valid)
     
@@ -349,7 +435,7 @@ class TestSecurityProperties(unittest.TestCase):
         # The scheme should work with valid shares
         combined_sig = self.ts.combine_signatures(valid_partial_sigs, key_shares[0].public_key)
         
-        dilithium = Dilithium(2)
+        dilithium = self.ts.dilithium
         is_valid = dilithium.verify(self.message, combined_sig, key_shares[0].public_key)
         self.assertTrue(is_valid)
 
@@ -8,7 +8,6 @@
 import unittest
 import hashlib
 from dilithium_threshold.core.threshold import ThresholdSignature
-from dilithium_threshold.core.dilithium import Dilithium
 
 
 class TestThresholdSignatureIntegrationFixed(unittest.TestCase):
@@ -66,7 +65,7 @@ class TestThresholdSignatureIntegrationFixed(unittest.TestCase):
             partial_signatures, public_key)
         
         # 4. Проверка с использованием стандартного Dilithium
-        dilithium = Dilithium(self.security_level)
+        dilithium = self.ts.dilithium
         is_valid = dilithium.verify(self.message, combined_signature, public_key)
         
         print(f"Комбинированная подпись: {'✓' if is_valid else '✗'}")
@@ -135,7 +134,7 @@ class TestThresholdSignatureIntegrationFixed(unittest.TestCase):
             
             # Комбинируем и проверяем
             combined_sig = ts.combine_signatures(partial_sigs, key_shares[0].public_key)
-            dilithium = Dilithium(self.security_level)
+            dilithium = ts.dilithium
             is_valid = dilithium.verify(self.message, combined_sig, key_shares[0].public_key)
             
             print(f"Конфигурация {threshold}/{participants}: {'✓' if is_valid else '✗'}")
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the Number Theoretic Transform.
+
+Tests that the NTT round-trips and that pointwise products in the
+NTT domain match polynomial multiplication in Rq.
+"""
+
+import unittest
+import numpy as np
+
+from dilithium_threshold.crypto.ntt import ntt, intt
+from dilithium_threshold.crypto.polynomials import Polynomial
+from dilithium_threshold.core.dilithium import Dilithium
+from dilithium_threshold.utils.constants import Q, N, ZETA, NTT_ZETAS, NTT_ZETAS_MONT
+
+
+class TestNTT(unittest.TestCase):
+    """Test cases for forward and inverse NTT."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.rng = np.random.default_rng(1234)
+    
+    def test_round_trip(self):
+        """Test that intt(ntt(a)) == a."""
+        coeffs = self.rng.integers(0, Q, size=N)
+        self.assertTrue(np.array_equal(intt(ntt(coeffs)), coeffs))
+    
+    def test_batched_transform(self):
+        """Test that leading dimensions are transformed independently."""
+        coeffs = self.rng.integers(0, Q, size=(2, 3, N))
+        batched = ntt(coeffs)
+        
+        self.assertEqual(batched.shape, (2, 3, N))
+        self.assertTrue(np.array_equal(batched[1, 2], ntt(coeffs[1, 2])))
+    
+    def test_bit_reversed_order(self):
+        """Test that ntt returns evaluations in bit-reversed order."""
+        coeffs = self.rng.integers(0, Q, size=N)
+        coeffs_hat = ntt(coeffs)
+        
+        # Entry j holds a(ZETA^(2 * bitrev8(j) + 1)), so no reordering is needed
+        for j in (0, 1, 2, 77, N - 1):
+            root = pow(ZETA, 2 * int(format(j, '08b')[::-1], 2) + 1, Q)
+            expected = sum(int(c) * pow(root, n, Q) for n, c in enumerate(coeffs)) % Q
+            self.assertEqual(coeffs_hat[j], expected)
+    
+    def test_zeta_tables(self):
+        """Test the precomputed twiddle tables in constants."""
+        self.assertEqual(NTT_ZETAS.shape, (N,))
+        self.assertEqual(NTT_ZETAS[0], 1)
+        self.assertEqual(NTT_ZETAS[1], pow(ZETA, 128, Q))
+        self.assertTrue(np.array_equal(NTT_ZETAS_MONT, NTT_ZETAS * 2**32 % Q))
+        
+        # Shared tables must not be modified in place
+        with self.assertRaises(ValueError):
+            NTT_ZETAS[0] = 0
+    
+    def test_pointwise_multiplication(self):
+        """Test that NTT-domain products match multiplication in Rq."""
+        poly1 = Polynomial(self.rng.integers(0, Q, size=N))
+        poly2 = Polynomial([1, -1, 0, 1])
+        
+        product = intt(ntt(poly1.coeffs) * ntt(poly2.coeffs) % Q)
+        expected = poly1 * poly2
+        
+        self.assertTrue(np.array_equal(product, expected.coeffs))
+    
+    def test_public_key_ntt_cached(self):
+        """Test that the NTT of A is computed once per public key."""
+        dilithium = Dilithium(2)
+        key_pair = dilithium.keygen(b"ntt_test_seed")
+        public_key = key_pair.public_key
+        
+        A_ntt = public_key.A_ntt
+        self.assertEqual(A_ntt.shape, (dilithium.k, dilithium.l, N))
+        self.assertIs(public_key.A_ntt, A_ntt)
+        self.assertTrue(np.array_equal(A_ntt[0, 1], ntt(public_key.A[0, 1])))
+        
+        # keygen hands the same transform to the private key
+        self.assertIs(key_pair.private_key.A_ntt, A_ntt)
+        self.assertTrue(np.array_equal(public_key.t_ntt[0], ntt(public_key.t[0].coeffs)))
+    
+    def test_matrix_vector_multiply(self):
+        """Test NTT-based A * s1 against polynomial-by-polynomial products."""
+        dilithium = Dilithium(2)
+        key_pair = dilithium.keygen(b"ntt_test_seed")
+        A = key_pair.public_key.A
+        s1 = key_pair.private_key.s1
+        
+        result = dilithium._matrix_vector_multiply(A, s1)
+        
+        for i in range(dilithium.k):
+            expected = Polynomial.zero()
+            for j in range(dilithium.l):
+                expected = expected + Polynomial(A[i, j]) * s1[j]
+            self.assertEqual(result[i], expected)
+        
+        # Secret vectors are transformed once per private key
+        s1_ntt = key_pair.private_key.s1_ntt
+        self.assertIs(key_pair.private_key.s1_ntt, s1_ntt)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -8,11 +8,6 @@ in the Dilithium threshold signature scheme.
 
 import unittest
 import numpy as np
-import sys
-import os
-
-# Add the src directory to the path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
 from dilithium_threshold.crypto.polynomials import Polynomial, PolynomialVector
 from dilithium_threshold.utils.constants import Q, N
@@ -78,6 +73,23 @@ class TestPolynomial(unittest.TestCase):
         self.assertEqual(result2.coeffs[1], 6)
         self.assertEqual(result2.coeffs[2], 9)
     
+    def test_polynomial_multiplication(self):
+        """Test polynomial multiplication in Rq."""
+        poly1 = Polynomial([1, 2])
+        poly2 = Polynomial([3, 4])
+        result = poly1 * poly2
+
+        self.assertEqual(result.coeffs[0], 3)
+        self.assertEqual(result.coeffs[1], 10)
+        self.assertEqual(result.coeffs[2], 8)
+
+        # X^(N-1) * X = X^N = -1
+        x_top = Polynomial([0] * (N - 1) + [1])
+        x = Polynomial([0, 1])
+        wrapped = x_top * x
+        self.assertEqual(wrapped.coeffs[0], Q - 1)
+        self.assertTrue(np.all(wrapped.coeffs[1:] == 0))
+
     def test_polynomial_negation(self):
         """Test polynomial negation."""
         poly = Polynomial([1, 2, 3])
@@ -95,6 +107,7 @@ class TestPolynomial(unittest.TestCase):
         
         self.assertEqual(poly1, poly2)
         self.assertNotEqual(poly1, poly3)
+        self.assertNotEqual(poly1, [1, 2, 3])
     
     def test_polynomial_norms(self):
         """Test polynomial norm calculations."""
@@ -103,6 +116,11 @@ class TestPolynomial(unittest.TestCase):
         
         inf_norm = poly.norm_infinity()
         self.assertGreaterEqual(inf_norm, 0)
+        self.assertEqual(inf_norm, 4)
+        
+        # Values above Q//2 count as their negative representatives
+        self.assertEqual(Polynomial([Q - 7, 5]).norm_infinity(), 7)
+        self.assertEqual(Polynomial([Q // 2]).norm_infinity(), Q // 2)
         
         l2_norm = poly.norm_l2()
         self.assertGreaterEqual(l2_norm, 0)
@@ -151,6 +169,20 @@ class TestPolynomial(unittest.TestCase):
         self.assertEqual(one.coeffs[0], 1)
         self.assertTrue(all(one.coeffs[i] == 0 for i in range(1, N)))
     
+    def test_polynomial_batch(self):
+        """Test batched construction from a coefficient matrix."""
+        rows = np.array([[1, -2, 3], [Q + 5, 0, 7]])
+        polys = Polynomial.batch(rows)
+        
+        self.assertEqual(len(polys), 2)
+        self.assertEqual(polys[0], Polynomial([1, -2, 3]))
+        self.assertEqual(polys[1], Polynomial([Q + 5, 0, 7]))
+        # Both polynomials share one backing array
+        self.assertIs(polys[0].coeffs.base, polys[1].coeffs.base)
+        
+        with self.assertRaises(ValueError):
+            Polynomial.batch(np.zeros((2, N + 1), dtype=np.int32))
+    
     def test_modular_reduction(self):
         """Test that coefficients are properly reduced modulo Q."""
         large_coeffs = [Q + 1, Q + 2, Q + 3]
@@ -159,6 +191,25 @@ class TestPolynomial(unittest.TestCase):
         self.assertEqual(poly.coeffs[0], 1)
         self.assertEqual(poly.coeffs[1], 2)
         self.assertEqual(poly.coeffs[2], 3)
+    
+    def test_arithmetic_wraparound(self):
+        """Test that results stay in [0, Q) across signed inputs."""
+        small_negative = Polynomial([-1, -(Q // 2)])
+        large = Polynomial([Q - 1, Q - 1])
+        
+        diff = small_negative - large
+        self.assertEqual(diff.coeffs[0], 0)
+        self.assertEqual(diff.coeffs[1], (-(Q // 2) - (Q - 1)) % Q)
+        
+        total = large + large
+        self.assertEqual(total.coeffs[0], Q - 2)
+        
+        negated = -small_negative
+        self.assertEqual(negated.coeffs[0], 1)
+        
+        # Coefficients beyond N wrap around with X^N = -1
+        wrapped = Polynomial([0] * N + [5])
+        self.assertEqual(wrapped.coeffs[0], Q - 5)
 
 
 class TestPolynomialVector(unittest.TestCase):
@@ -268,8 +319,29 @@ class TestPolynomialVector(unittest.TestCase):
             self.assertTrue(poly.is_zero())
         
         # Random vector
-        random_vector = PolynomialVector.random(2, 100)
+        random_vector = PolynomialVector.random(2, 100, seed=7)
         self.assertEqual(len(random_vector), 2)
+        self.assertLess(random_vector.norm_infinity(), 100)
+        self.assertEqual(random_vector, PolynomialVector.random(2, 100, seed=7))
+    
+    def test_vector_matrix_storage(self):
+        """Test construction from a coefficient matrix and row views."""
+        matrix = np.array([[1, -2] + [0] * (N - 2),
+                           [Q + 3] + [0] * (N - 1)], dtype=np.int64)
+        vector = PolynomialVector(matrix)
+        
+        self.assertEqual(vector.coeffs2d.shape, (2, N))
+        self.assertEqual(vector.coeffs2d.dtype, np.int32)
+        self.assertEqual(vector[0], Polynomial([1, -2]))
+        self.assertEqual(vector[1], Polynomial([3]))
+        self.assertEqual(vector, PolynomialVector([Polynomial([1, -2]), Polynomial([3])]))
+        
+        # Polynomials share memory with the coefficient matrix
+        vector.polys[0].coeffs[0] = 7
+        self.assertEqual(vector.coeffs2d[0, 0], 7)
+        
+        with self.assertRaises(ValueError):
+            PolynomialVector(np.zeros((2, N - 1), dtype=np.int32))
     
     def test_vector_length_mismatch(self):
         """Test operations with mismatched vector lengths."""
@@ -8,16 +8,17 @@ to work with polynomial vectors from Dilithium.
 
 import unittest
 import numpy as np
-import sys
-import os
 
-# Add the src directory to the path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
-
-from dilithium_threshold.core.shamir import AdaptedShamirSSS, ShamirShare
+from dilithium_threshold.core.shamir import (
+    AdaptedShamirSSS, ShamirShare, _lagrange_coefficients, _batch_mod_inverse
+)
+from dilithium_threshold.crypto.ntt import ntt
 from dilithium_threshold.crypto.polynomials import Polynomial, PolynomialVector
 from dilithium_threshold.utils.constants import Q, N
 
+# Seeded generator shared by the randomized tests in this module
+_RNG = np.random.default_rng(42)
+
 
 class TestShamirShare(unittest.TestCase):
     """Test cases for ShamirShare class."""
@@ -35,6 +36,30 @@ class TestShamirShare(unittest.TestCase):
         self.assertEqual(self.share.vector_length, 2)
         self.assertEqual(self.share.share_vector, self.share_vector)
     
+    def test_share_matrix(self):
+        """Test contiguous coefficient matrix storage."""
+        self.assertEqual(self.share.share_matrix.shape, (2, N))
+        self.assertEqual(self.share.share_matrix.dtype, np.int32)
+        self.assertEqual(self.share.share_matrix[1, 0], 6)
+        
+        # Shares can be built directly from a coefficient matrix
+        matrix_share = ShamirShare(1, self.share.share_matrix)
+        self.assertEqual(matrix_share, self.share)
+        self.assertEqual(matrix_share.share_vector, self.share_vector)
+    
+    def test_share_vector_assignment(self):
+        """Test that share_vector edits and assignments update the share."""
+        self.share.share_ntt
+        self.share.share_vector = PolynomialVector([self.poly2])
+        self.assertEqual(self.share.vector_length, 1)
+        self.assertEqual(self.share.share_matrix[0, 0], 6)
+        self.assertTrue(np.array_equal(self.share.share_ntt,
+                                       ntt(self.share.share_matrix)))
+        
+        # In-place edits write through to the coefficient matrix
+        self.share.share_vector[0].coeffs[0] = 11
+        self.assertEqual(self.share.share_matrix[0, 0], 11)
+    
     def test_invalid_participant_id(self):
         """Test that invalid participant IDs are rejected."""
         with self.assertRaises(ValueError):
@@ -71,6 +96,10 @@ class TestAdaptedShamirSSS(unittest.TestCase):
         self.assertEqual(self.shamir.participants, self.participants)
         self.assertEqual(len(self.shamir.participant_ids), self.participants)
         self.assertEqual(self.shamir.participant_ids, [1, 2, 3, 4, 5])
+        
+        # Vandermonde table pid^d mod Q is built once per scheme
+        self.assertEqual(self.shamir._vandermonde.shape, (self.participants, self.threshold))
+        self.assertEqual(self.shamir._vandermonde[3].tolist(), [1, 4, 16])
     
     def test_invalid_threshold_config(self):
         """Test that invalid threshold configurations are rejected."""
@@ -190,6 +219,38 @@ class TestAdaptedShamirSSS(unittest.TestCase):
         result4 = self.shamir._lagrange_interpolation(points, 4)
         self.assertEqual(result4 % Q, 11)  # Should be 2*4 + 3 = 11
     
+    def test_lagrange_coefficients(self):
+        """Test cached Lagrange coefficients at x=0."""
+        # f(x) = 2x + 3 sampled at x = 1, 2, 3
+        ids = (1, 2, 3)
+        values = [5, 7, 9]
+        
+        lambdas = _lagrange_coefficients(ids)
+        self.assertEqual(len(lambdas), 3)
+        self.assertEqual(sum(l * v for l, v in zip(lambdas, values)) % Q, 3)
+        
+        # Same signer set hits the cache
+        self.assertIs(_lagrange_coefficients(ids), lambdas)
+        
+        # Batched inversion agrees with one inversion per value
+        denominators = [2, Q - 1, 12345, 7]
+        inverses = _batch_mod_inverse(denominators)
+        self.assertEqual(inverses, [pow(d, Q - 2, Q) for d in denominators])
+    
+    def test_random_coefficients(self):
+        """Test range and determinism of Shamir polynomial coefficients."""
+        shape = (2, N, self.threshold - 1)
+        coeffs = self.shamir._random_coefficients(shape, b"coefficient_seed")
+        
+        self.assertEqual(coeffs.shape, shape)
+        signed = np.where(coeffs > Q // 2, coeffs - Q, coeffs)
+        self.assertGreaterEqual(np.abs(signed).min(), 50)
+        self.assertLessEqual(np.abs(signed).max(), 2000)
+        self.assertTrue((signed < 0).any() and (signed > 0).any())
+        
+        again = self.shamir._random_coefficients(shape, b"coefficient_seed")
+        self.assertTrue(np.array_equal(coeffs, again))
+    
     def test_polynomial_evaluation(self):
         """Test polynomial evaluation."""
         # Test polynomial: f(x) = 1 + 2x + 3x^2
@@ -203,6 +264,11 @@ class TestAdaptedShamirSSS(unittest.TestCase):
         
         # f(2) = 1 + 4 + 12 = 17
         self.assertEqual(self.shamir._evaluate_polynomial(coeffs, 2), 17)
+        
+        # Several polynomials at once
+        shamir_polys = np.array([[1, 2, 3], [5, Q - 1, 7]])
+        values = self.shamir._evaluate_polynomial(shamir_polys, 3)
+        self.assertEqual(values.tolist(), [34, (5 - 3 + 63) % Q])
     
     def test_different_vector_lengths(self):
         """Test with different polynomial vector lengths."""
@@ -213,8 +279,10 @@ class TestAdaptedShamirSSS(unittest.TestCase):
         self.assertEqual(reconstructed, single_poly)
         
         # Test with longer vector
-        poly3 = Polynomial([100, 200, 300])
-        long_vector = PolynomialVector([self.secret_poly1, self.secret_poly2, poly3])
+        polys = Polynomial.batch(np.array([[1, 2, 3, 4, 5],
+                                           [10, 20, 30, 40, 50],
+                                           [100, 200, 300, 0, 0]]))
+        long_vector = PolynomialVector(polys)
         shares2 = self.shamir.split_secret(long_vector)
         reconstructed2 = self.shamir.reconstruct_secret(shares2[:self.threshold])
         self.assertEqual(reconstructed2, long_vector)
@@ -233,10 +301,8 @@ class TestAdaptedShamirSSS(unittest.TestCase):
     def test_random_polynomial_reconstruction(self):
         """Test reconstruction with random polynomials."""
         # Generate random polynomial vector
-        random_polys = []
-        for _ in range(3):
-            coeffs = np.random.randint(0, 1000, size=10)
-            random_polys.append(Polynomial(coeffs))
+        coeffs = _RNG.integers(0, 1000, size=(3, 10), dtype=np.int64)
+        random_polys = Polynomial.batch(coeffs)
         
         random_vector = PolynomialVector(random_polys)
         